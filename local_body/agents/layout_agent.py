@@ -102,13 +102,13 @@ class LayoutAgent(BaseAgent):
             logger.debug(f"Processing page {page.page_number}")
             
             # Skip pages without images
-            if not page.raw_image_bytes:
-                logger.warning(f"Page {page.page_number} has no raw_image_bytes, skipping")
+            if not page.has_raw_image:
+                logger.warning(f"Page {page.page_number} has no raw image, skipping")
                 continue
             
             # Convert raw bytes to image
             try:
-                image = self._bytes_to_image(page.raw_image_bytes)
+                image = self._pil_to_bgr(page.get_decoded_image())
             except Exception as e:
                 logger.error(f"Failed to convert page {page.page_number} image: {e}")
                 continue
@@ -142,9 +142,17 @@ class LayoutAgent(BaseAgent):
         Returns:
             Numpy array in BGR format (OpenCV)
         """
-        # Convert bytes to PIL Image
-        pil_image = Image.open(io.BytesIO(image_bytes))
+        return self._pil_to_bgr(Image.open(io.BytesIO(image_bytes)))
+    
+    def _pil_to_bgr(self, pil_image: Image.Image) -> np.ndarray:
+        """Convert a PIL image to a BGR numpy array for YOLO.
         
+        Args:
+            pil_image: Decoded PIL image (not modified)
+            
+        Returns:
+            Numpy array in BGR format (OpenCV)
+        """
         # Convert to RGB if needed
         if pil_image.mode != 'RGB':
             pil_image = pil_image.convert('RGB')
@@ -176,6 +184,8 @@ class LayoutAgent(BaseAgent):
             logger.debug(f"No detections on page {page_number}")
             return regions
         
+        region_ids = iter(Region.new_ids(len(boxes)))
+        
         for box in boxes:
             # Extract box coordinates (xyxy format)
             x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
@@ -192,19 +202,22 @@ class LayoutAgent(BaseAgent):
             # Map YOLO class to RegionType
             region_type = self.YOLO_TO_REGION_TYPE.get(cls_id, RegionType.IMAGE)
             
+            # Validate bounding box (non-zero area) before building it, so
+            # rejected proposals allocate nothing
+            width = float(x2 - x1)
+            height = float(y2 - y1)
+            if width <= 0 or height <= 0:
+                logger.warning(f"Invalid bounding box with zero area, skipping")
+                continue
+            
             # Calculate bounding box
             bbox = BoundingBox(
                 x=float(x1),
                 y=float(y1),
-                width=float(x2 - x1),
-                height=float(y2 - y1)
+                width=width,
+                height=height
             )
             
-            # Validate bounding box (non-zero area)
-            if bbox.width <= 0 or bbox.height <= 0:
-                logger.warning(f"Invalid bounding box with zero area, skipping")
-                continue
-            
             # Create placeholder content based on region type
             # (Real content extraction happens in OCRAgent/VisionAgent)
             if region_type == RegionType.TEXT:
@@ -221,7 +234,8 @@ class LayoutAgent(BaseAgent):
                 region_type=region_type,
                 content=content,
                 confidence=confidence,
-                extraction_method="yolov8"
+                extraction_method="yolov8",
+                id=next(region_ids)
             )
             
             regions.append(region)
@@ -8,7 +8,7 @@ This module implements the OCRAgent class with a 3-stage adaptive retry pipeline
 
 import io
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 import cv2
@@ -30,6 +30,55 @@ from local_body.core.datamodels import (
 from local_body.utils.preprocessing import ImagePreprocessor
 
 
+# Crop payload handed between pipeline stages: a BGR ndarray (default) or
+# encoded image bytes when crop_format is "jpg"/"png".
+CropImage = Union[np.ndarray, bytes]
+
+CROP_FORMATS = ("ndarray", "jpg", "png")
+
+
+def _decode_crop(crop: CropImage) -> Optional[np.ndarray]:
+    """Return a BGR ndarray for a crop, decoding only if it is encoded bytes."""
+    if isinstance(crop, np.ndarray):
+        return crop
+    nparr = np.frombuffer(crop, np.uint8)
+    return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+
+def _fast_preprocess(
+    np_rgb: np.ndarray,
+    mean: List[float],
+    std: List[float],
+    size: Tuple[int, int]
+) -> np.ndarray:
+    """Fused resize + rescale + normalize + HWC->NCHW for TrOCR.
+    
+    Equivalent to TrOCRProcessor's image pipeline, computed as
+    ``out[c, h, w] = (img[h, w, c] / 255 - mean[c]) / std[c]`` with the
+    rescale and normalize folded into a single multiply-add.
+    
+    Args:
+        np_rgb: Decoded RGB image (H, W, 3) uint8
+        mean: Per-channel normalization mean
+        std: Per-channel normalization std
+        size: Target (height, width)
+        
+    Returns:
+        Contiguous float32 array of shape (1, 3, height, width)
+    """
+    height, width = size
+    resized = cv2.resize(np_rgb, (width, height), interpolation=cv2.INTER_LINEAR)
+    
+    std_arr = np.asarray(std, dtype=np.float32)
+    scale = 1.0 / (255.0 * std_arr)
+    offset = np.asarray(mean, dtype=np.float32) / std_arr
+    
+    out = np.empty((1, 3, height, width), dtype=np.float32)
+    np.multiply(resized.transpose(2, 0, 1), scale[:, None, None], out=out[0])
+    out[0] -= offset[:, None, None]
+    return out
+
+
 class TrOCRHandler:
     """Lazy-loaded TrOCR handler for handwriting recognition fallback."""
     
@@ -56,14 +105,27 @@ class TrOCRHandler:
             logger.error(f"Failed to load TrOCR: {e}")
             raise
     
-    def recognize_handwriting(self, image_bytes: bytes) -> str:
+    def recognize_handwriting(self, image: CropImage) -> str:
         """Extract text from handwritten image using Transformer model."""
         if self._model is None:
             self._load_model()
         
         try:
-            pil_image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-            pixel_values = self._processor(images=pil_image, return_tensors="pt").pixel_values.to(self._device)
+            import torch
+            
+            bgr = _decode_crop(image)
+            if bgr is None:
+                raise ValueError("Decode failed")
+            np_rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            
+            image_processor = self._processor.image_processor
+            size = image_processor.size
+            pixel_values = torch.from_numpy(_fast_preprocess(
+                np_rgb,
+                image_processor.image_mean,
+                image_processor.image_std,
+                (size["height"], size["width"])
+            )).to(self._device)
             
             generated_ids = self._model.generate(pixel_values)
             text = self._processor.batch_decode(generated_ids, skip_special_tokens=True)[0].strip()
@@ -85,6 +147,12 @@ class OCRAgent(BaseAgent):
         self.confidence_threshold = self.get_config("confidence_threshold", 0.85)
         self.fallback_threshold = self.get_config("fallback_threshold", 0.60)
         
+        # Crops are for OCR consumption only, so by default they stay as
+        # in-memory ndarrays instead of being re-encoded per region
+        self.crop_format = self.get_config("crop_format", "ndarray")
+        if self.crop_format not in CROP_FORMATS:
+            raise ValueError(f"crop_format must be one of {CROP_FORMATS}, got {self.crop_format!r}")
+        
         # Initialize PaddleOCR
         lang = self.get_config("lang", "en")
         use_angle_cls = self.get_config("use_angle_cls", True)
@@ -106,51 +174,74 @@ class OCRAgent(BaseAgent):
         logger.info(f"Processing document {document.id} for OCR extraction")
         
         for page in document.pages:
-            if not page.raw_image_bytes:
+            if not page.has_raw_image:
                 continue
             
-            for region in page.regions:
-                if region.region_type not in [RegionType.TEXT, RegionType.TABLE]:
-                    continue
-                
-                try:
-                    # Crop
-                    crop_bytes = self._crop_region(page.raw_image_bytes, region.bbox)
-                    
-                    # Run 3-Stage Pipeline
-                    text, confidence = await self._process_single_region(crop_bytes, region.id)
-                    
-                    # Store Result
-                    if region.region_type == RegionType.TEXT:
-                        region.content = TextContent(text=text, confidence=confidence)
-                    else:
-                        rows = self._parse_table_structure(text)
-                        region.content = TableContent(rows=rows, confidence=confidence)
-                        
-                    logger.debug(f"Region {region.id} extracted: {confidence:.1%}")
-                    
-                except Exception as e:
-                    # Fallback: Try PyPDF2 text extraction when OCR fails
-                    logger.warning(f"Region {region.id}: OCR failed ({type(e).__name__}). Attempting PyPDF2 fallback...")
-                    text = self._extract_text_pypdf2(document.file_path, page.page_number)
-                    
-                    if text and len(text.strip()) > 0:
-                        confidence = 0.95
-                        logger.success(f"Region {region.id}: Extracted {len(text)} chars via PyPDF2")
-                        region.content = TextContent(text=text, confidence=confidence)
-                    else:
-                        # No fallback available
-                        logger.warning(f"Region {region.id}: PyPDF2 fallback also failed - no text extracted")
-                        region.content = TextContent(text="", confidence=0.0)
+            ocr_regions = [
+                r for r in page.regions
+                if r.region_type in (RegionType.TEXT, RegionType.TABLE)
+            ]
+            if not ocr_regions:
+                continue
+            
+            # Decode the page once; every region is cropped from this array
+            try:
+                page_image = self._decode_page(page.read_raw_image())
+            except ValueError:
+                page_image = None
+            
+            await self._process_page_regions(document, page, ocr_regions, page_image)
         
         return document
 
-    async def _process_single_region(self, crop_bytes: bytes, region_id: str) -> Tuple[str, float]:
+    async def _process_page_regions(
+        self,
+        document: Document,
+        page: Page,
+        regions: List[Region],
+        page_image: Optional[np.ndarray]
+    ) -> None:
+        """Run OCR over the text/table regions of one decoded page."""
+        for region in regions:
+            try:
+                if page_image is None:
+                    raise ValueError("Decode failed")
+                
+                # Crop
+                crop = self._crop_region(page_image, region.bbox)
+                
+                # Run 3-Stage Pipeline
+                text, confidence = await self._process_single_region(crop, region.id)
+                
+                # Store Result
+                if region.region_type == RegionType.TEXT:
+                    region.content = TextContent(text=text, confidence=confidence)
+                else:
+                    rows = self._parse_table_structure(text)
+                    region.content = TableContent(rows=rows, confidence=confidence)
+                    
+                logger.debug(f"Region {region.id} extracted: {confidence:.1%}")
+                
+            except Exception as e:
+                # Fallback: Try PyPDF2 text extraction when OCR fails
+                logger.warning(f"Region {region.id}: OCR failed ({type(e).__name__}). Attempting PyPDF2 fallback...")
+                text = self._extract_text_pypdf2(document.file_path, page.page_number)
+                
+                if text and len(text.strip()) > 0:
+                    confidence = 0.95
+                    logger.success(f"Region {region.id}: Extracted {len(text)} chars via PyPDF2")
+                    region.content = TextContent(text=text, confidence=confidence)
+                else:
+                    # No fallback available
+                    logger.warning(f"Region {region.id}: PyPDF2 fallback also failed - no text extracted")
+                    region.content = TextContent(text="", confidence=0.0)
+
+    async def _process_single_region(self, crop: CropImage, region_id: str) -> Tuple[str, float]:
         """Execute 3-Stage Adaptive Retry Pipeline."""
         
         # --- Stage 1: Standard OCR ---
         try:
-            result1 = self._run_ocr(crop_bytes)
+            result1 = self._run_ocr(crop)
             text, conf = self._parse_ocr_result(result1)
         except (NotImplementedError, ImportError, Exception) as e:
             # PaddleOCR failed - log quietly and return empty for fallback
@@ -162,9 +253,8 @@ class OCRAgent(BaseAgent):
             
         # --- Stage 2: Enhanced OCR ---
         try:
-            # Decode for quality assessment
-            nparr = np.frombuffer(crop_bytes, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # Decode for quality assessment (no-op for ndarray crops)
+            image = _decode_crop(crop)
             
             if image is not None:
                 quality = self.preprocessor.assess_image_quality(image)
@@ -196,7 +286,7 @@ class OCRAgent(BaseAgent):
         if conf < self.fallback_threshold and self.trocr_handler and text.strip():
             logger.warning(f"Region {region_id}: Low conf ({conf:.1%}). Attempting TrOCR fallback...")
             try:
-                trocr_text = self.trocr_handler.recognize_handwriting(crop_bytes)
+                trocr_text = self.trocr_handler.recognize_handwriting(crop)
                 if trocr_text and len(trocr_text) > 2:
                     logger.success(f"Region {region_id}: TrOCR recovered: '{trocr_text}'")
                     return trocr_text, 0.95
@@ -205,22 +295,39 @@ class OCRAgent(BaseAgent):
                 
         return text, conf
 
-    def _crop_region(self, image_bytes: bytes, bbox: BoundingBox) -> bytes:
+    def _decode_page(self, image_bytes: bytes) -> np.ndarray:
+        """Decode an encoded page image to a BGR ndarray."""
         nparr = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        decoded = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        if decoded is None:
+            raise ValueError("Decode failed")
+        return decoded
+
+    def _crop_region(self, image: CropImage, bbox: BoundingBox) -> CropImage:
+        """Crop a region for OCR consumption.
+        
+        Accepts the already-decoded page (or its encoded bytes). Returns the
+        BGR ndarray directly when crop_format is "ndarray"; otherwise encodes
+        it as JPEG (quality 95) or lossless PNG.
+        """
+        image = _decode_crop(image)
         if image is None: 
             raise ValueError("Decode failed")
         h, w = image.shape[:2]
         x1, y1 = max(0, int(bbox.x)), max(0, int(bbox.y))
         x2, y2 = min(w, int(bbox.x + bbox.width)), min(h, int(bbox.y + bbox.height))
         cropped = image[y1:y2, x1:x2]
-        success, encoded = cv2.imencode('.png', cropped)
+        
+        if self.crop_format == "ndarray":
+            return cropped
+        if self.crop_format == "jpg":
+            success, encoded = cv2.imencode('.jpg', cropped, [cv2.IMWRITE_JPEG_QUALITY, 95])
+        else:
+            success, encoded = cv2.imencode('.png', cropped)
         return encoded.tobytes()
 
-    def _run_ocr(self, image_bytes: bytes) -> List:
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        return self.ocr.ocr(image)
+    def _run_ocr(self, image: CropImage) -> List:
+        return self.ocr.ocr(_decode_crop(image))
 
     def _parse_ocr_result(self, ocr_result: List) -> Tuple[str, float]:
         if not ocr_result or not ocr_result[0]: 
@@ -6,14 +6,100 @@ vision model analysis, particularly for numeric values in tables and charts.
 Requirements: 11.1 (Conflict Detection), 11.2 (Normalization), 11.3 (Threshold-based Detection)
 """
 
-import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+import numpy as np
 from loguru import logger
 
 from local_body.agents.base import BaseAgent
 from local_body.core.datamodels import Document, Region, Conflict, ConflictType, RegionType
 
 
+# Lookup tables for the numeric scanner used by extract_numeric_value
+_CURRENCY_SYMBOLS = frozenset('$€£¥')
+_DIGITS = frozenset('0123456789')
+_SUFFIX_WHITESPACE = frozenset(' \t\n\r\f\v')
+
+_MULTIPLIERS = {
+    'K': 1_000,
+    'M': 1_000_000,
+    'B': 1_000_000_000,
+    'T': 1_000_000_000_000
+}
+
+
+def _scan_number(text: str) -> Optional[float]:
+    """Single-pass scanner for numeric values in OCR/vision text.
+    
+    Walks the string once, reading each number as optional sign (which may
+    precede a currency symbol), digits with thousands commas and at most one
+    decimal point. Any '%' in the text turns the first number into a
+    fraction; otherwise the first number followed by a K/M/B/T suffix wins,
+    falling back to the first plain number.
+    """
+    n = len(text)
+    is_percent = '%' in text
+    first = None
+    i = 0
+    
+    while i < n:
+        ch = text[i]
+        if ch not in _DIGITS and not (ch == '.' and i + 1 < n and text[i + 1] in _DIGITS):
+            i += 1
+            continue
+        
+        # Sign may sit before a currency symbol: "-$5", "$-5"
+        j = i - 1
+        while j >= 0 and text[j] in _CURRENCY_SYMBOLS:
+            j -= 1
+        negative = j >= 0 and text[j] == '-'
+        
+        chars = []
+        seen_dot = False
+        while i < n:
+            ch = text[i]
+            if ch in _DIGITS:
+                chars.append(ch)
+            elif ch == '.' and not seen_dot and i + 1 < n and text[i + 1] in _DIGITS:
+                seen_dot = True
+                chars.append(ch)
+            elif not (ch == ',' and i + 1 < n and text[i + 1] in _DIGITS):
+                break
+            i += 1
+        
+        value = float(''.join(chars))
+        if negative:
+            value = -value
+        
+        if is_percent:
+            return value / 100.0
+        
+        # Peek past whitespace for a multiplier suffix
+        k = i
+        while k < n and text[k] in _SUFFIX_WHITESPACE:
+            k += 1
+        if k < n:
+            multiplier = _MULTIPLIERS.get(text[k].upper())
+            if multiplier is not None:
+                return value * multiplier
+        
+        if first is None:
+            first = value
+    
+    return first
+
+
+@lru_cache(maxsize=8192)
+def _extract_numeric_value(text: str) -> Optional[float]:
+    """Memoized numeric extraction; cell values and axis labels recur a lot."""
+    if not text:
+        return None
+    # Bare integer cells ("1234") parse entirely in C via float()
+    if text.isascii() and text.isdigit():
+        return float(text)
+    return _scan_number(text)
+
+
 class ValidationAgent(BaseAgent):
     """Agent for detecting conflicts between OCR and vision extraction."""
     
@@ -54,50 +140,27 @@ class ValidationAgent(BaseAgent):
         Returns:
             Extracted float value or None if not found
         """
-        if not text:
-            return None
-        
-        # Handle percentages first
-        if '%' in text:
-            cleaned = re.sub(r'[$€£¥%]', '', text).strip()
-            match = re.search(r'[-+]?\d*\.?\d+', cleaned)
-            if match:
-                try:
-                    return float(match.group()) / 100.0
-                except ValueError:
-                    pass
-        
-        # Handle multipliers (K, M, B, T) with optional currency
-        multipliers = {
-            'K': 1_000,
-            'M': 1_000_000,
-            'B': 1_000_000_000,
-            'T': 1_000_000_000_000
-        }
-        
-        for suffix, multiplier in multipliers.items():
-            # Pattern: optional currency, digits with optional comma/dot, then suffix
-            pattern = r'[$€£¥]?\s*([-+]?\d+(?:[,\.]\d+)*)\s*' + suffix
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                num_str = match.group(1).replace(',', '')
-                try:
-                    return float(num_str) * multiplier
-                except ValueError:
-                    pass
-        
-        # Remove currency symbols for regular numbers
-        cleaned = re.sub(r'[$€£¥]', '', text).strip().replace(',', '')
-        
-        # Extract first number found
-        match = re.search(r'[-+]?\d*\.?\d+', cleaned)
-        if match:
-            try:
-                return float(match.group())
-            except ValueError:
-                pass
+        return _extract_numeric_value(text)
+    
+    @classmethod
+    def get_numeric_cache_stats(cls) -> Dict[str, int]:
+        """Get numeric extraction cache statistics.
         
-        return None
+        Returns:
+            Dictionary with cache metrics
+        """
+        info = _extract_numeric_value.cache_info()
+        return {
+            'entries': info.currsize,
+            'max_entries': info.maxsize,
+            'hits': info.hits,
+            'misses': info.misses
+        }
+    
+    @classmethod
+    def clear_numeric_cache(cls) -> None:
+        """Clear the numeric extraction cache."""
+        _extract_numeric_value.cache_clear()
     
     def validate(
         self,
@@ -121,69 +184,109 @@ class ValidationAgent(BaseAgent):
         
         logger.info(f"Validating document {document.id} with {len(vision_results)} vision results")
         
-        # Iterate through all regions in document
-        for page in document.pages:
-            for region in page.regions:
-                # Skip if no vision result for this region
-                if region.id not in vision_results:
-                    continue
-                
-                # Get OCR text
-                ocr_text = None
-                if hasattr(region.content, 'text'):
-                    ocr_text = region.content.text
-                
-                if not ocr_text:
-                    continue
-                
-                # Get vision text
-                vision_text = vision_results.get(region.id, '')
-                if not vision_text:
-                    continue
-                
-                # Extract numeric values
-                ocr_value = self.extract_numeric_value(ocr_text)
-                vision_value = self.extract_numeric_value(vision_text)
-                
-                if ocr_value is None or vision_value is None:
-                    logger.debug(f"Region {region.id}: No numeric values found")
-                    continue
-                
-                # Calculate discrepancy
-                if max(abs(ocr_value), abs(vision_value)) == 0:
-                    discrepancy = 0.0
-                else:
-                    discrepancy = abs(ocr_value - vision_value) / max(abs(ocr_value), abs(vision_value))
-                
-                # Check against threshold
-                if discrepancy > self.conflict_threshold:
-                    conflict = Conflict(
-                        region_id=region.id,
-                        conflict_type=ConflictType.VALUE_MISMATCH,
-                        text_value=ocr_value,
-                        vision_value=vision_value,
-                        discrepancy_percentage=discrepancy,
-                        confidence_scores={
-                            'text': region.confidence,
-                            'vision': 0.8  # Default vision confidence
-                        }
-                    )
-                    
-                    # Calculate impact score
-                    region_type_str = region.region_type.value if isinstance(region.region_type, RegionType) else str(region.region_type)
-                    conflict.update_impact_score(region_type_str)
-                    
-                    conflicts.append(conflict)
-                    logger.warning(
-                        f"Conflict detected in region {region.id}: "
-                        f"OCR={ocr_value}, Vision={vision_value}, "
-                        f"Discrepancy={discrepancy:.2%}"
-                    )
-                else:
-                    logger.debug(
-                        f"Region {region.id}: Values match within threshold "
-                        f"(OCR={ocr_value}, Vision={vision_value}, Discrepancy={discrepancy:.2%})"
-                    )
+        # Collect (region, ocr_value, vision_value) for regions with numbers on both sides
+        # Vision usually covers only a few regions, so walk vision_results
+        # and resolve regions through an id index instead of scanning pages
+        region_index = {
+            region.id: region
+            for page in document.pages
+            for region in page.regions
+        }
+        
+        pairs = []
+        for region_id, vision_text in vision_results.items():
+            region = region_index.get(region_id)
+            if region is None or not vision_text:
+                continue
+            
+            # Get OCR text
+            ocr_text = getattr(region.content, 'text', None)
+            if not ocr_text:
+                continue
+            
+            # Identical readings cannot conflict; skip parsing entirely
+            if ocr_text.strip() == vision_text.strip():
+                continue
+            
+            # Extract numeric values
+            ocr_value = self.extract_numeric_value(ocr_text)
+            vision_value = self.extract_numeric_value(vision_text)
+            
+            if ocr_value is None or vision_value is None:
+                logger.opt(lazy=True).debug("Region {}: No numeric values found", lambda: region_id)
+                continue
+            
+            pairs.append((region, ocr_value, vision_value))
+        
+        if not pairs:
+            logger.info("Validation complete: 0 conflicts detected")
+            return conflicts
+        
+        # Relative discrepancy for all pairs at once (0 where both values are 0)
+        count = len(pairs)
+        ocr_values = np.fromiter((p[1] for p in pairs), dtype=np.float64, count=count)
+        vision_values = np.fromiter((p[2] for p in pairs), dtype=np.float64, count=count)
+        scale = np.maximum(np.abs(ocr_values), np.abs(vision_values))
+        discrepancies = np.divide(
+            np.abs(ocr_values - vision_values),
+            scale,
+            out=np.zeros(count, dtype=np.float64),
+            where=scale != 0
+        )
+        
+        # Only regions over threshold need Python-level work
+        over_threshold = np.flatnonzero(discrepancies > self.conflict_threshold)
+        conflicts.extend([
+            self._build_conflict(*pairs[idx], float(discrepancies[idx]))
+            for idx in over_threshold
+        ])
+        
+        for conflict in conflicts:
+            logger.warning(
+                f"Conflict detected in region {conflict.region_id}: "
+                f"OCR={conflict.text_value}, Vision={conflict.vision_value}, "
+                f"Discrepancy={conflict.discrepancy_percentage:.2%}"
+            )
+        
+        logger.debug(
+            "{} of {} numeric regions match within threshold",
+            count - len(conflicts), count
+        )
         
         logger.info(f"Validation complete: {len(conflicts)} conflicts detected")
         return conflicts
+    
+    @staticmethod
+    def _build_conflict(
+        region: Region,
+        ocr_value: float,
+        vision_value: float,
+        discrepancy: float
+    ) -> Conflict:
+        """Create a scored VALUE_MISMATCH conflict for a region.
+        
+        Args:
+            region: Region the values were read from
+            ocr_value: Value extracted from OCR text
+            vision_value: Value extracted from vision analysis
+            discrepancy: Relative discrepancy between the two values
+            
+        Returns:
+            Conflict with impact score populated
+        """
+        conflict = Conflict(
+            region_id=region.id,
+            conflict_type=ConflictType.VALUE_MISMATCH,
+            text_value=ocr_value,
+            vision_value=vision_value,
+            discrepancy_percentage=discrepancy,
+            confidence_scores={
+                'text': region.confidence,
+                'vision': 0.8  # Default vision confidence
+            }
+        )
+        
+        # Calculate impact score
+        region_type_str = region.region_type.value if isinstance(region.region_type, RegionType) else str(region.region_type)
+        conflict.update_impact_score(region_type_str)
+        return conflict
@@ -4,18 +4,50 @@ This agent sends images to the Cloud Brain (Colab) for vision-language analysis
 with caching, retry logic, and local fallback capabilities.
 """
 
+import asyncio
 import hashlib
+import threading
+from collections import OrderedDict
 import httpx
 from typing import Dict, Any, Optional
 from io import BytesIO
 from PIL import Image
 from loguru import logger
 
+# BLAKE3 for cache keys (optional - SIMD-accelerated, falls back to hashlib)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# libvips for streaming decode+resize+encode (optional - falls back to PIL)
+try:
+    import pyvips
+    PYVIPS_AVAILABLE = True
+except (ImportError, OSError):
+    PYVIPS_AVAILABLE = False
+
+# HTTP/2 support for httpx (optional - multiplexes concurrent page uploads)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from local_body.agents.base import BaseAgent
-from local_body.core.datamodels import Document
+from local_body.core.datamodels import Document, Page
 from local_body.tunnel.secure_tunnel import SecureTunnel
 
 
+# Below this size, image+query are hashed in a single update() call
+_SMALL_IMAGE_BYTES = 64 * 1024
+
+# JPEGs under this size that already fit max_image_size are sent as-is
+_PASSTHROUGH_JPEG_BYTES = 300_000
+_JPEG_MAGIC = b'\xff\xd8\xff'
+
+
 class VisionAgent(BaseAgent):
     """Vision inference agent with remote Cloud Brain and local fallback.
     
@@ -41,19 +73,32 @@ class VisionAgent(BaseAgent):
         super().__init__(agent_type="vision", config=config)
         
         self.tunnel = tunnel
-        self._cache: Dict[str, str] = {}
+        
+        # Bounded LRU result cache (OrderedDict, most recent at the end)
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self.cache_max = self.get_config("cache_max", 1024)
+        self._cache_hits = 0
+        self._cache_misses = 0
         
         # Configuration
         self.max_retries = self.get_config("max_retries", 3)
         self.timeout = self.get_config("timeout", 30)
         self.enable_cache = self.get_config("enable_cache", True)
         self.fallback_model = self.get_config("fallback_model", "llama3.2-vision")
+        self.max_concurrency = self.get_config("max_concurrency", 4)
         
         # Image compression settings
         self.api_key = self.get_config("brain_secret", "sovereign-secret-key")
         self.max_image_size = 1024
         self.jpeg_quality = 85
         
+        # Per-thread scratch buffer for JPEG output, reused across pages
+        self._compress_local = threading.local()
+        
+        # Persistent HTTP client (created lazily, bound to one event loop)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         logger.info(f"VisionAgent initialized (retries={self.max_retries}, timeout={self.timeout}s)")
     
     async def process(self, document: Document) -> Document:
@@ -67,42 +112,97 @@ class VisionAgent(BaseAgent):
         """
         logger.info(f"Processing document {document.id} with vision analysis")
         
-        for page_idx, page in enumerate(document.pages):
-            if not page.raw_image_bytes:
-                logger.warning(f"Page {page_idx} has no image bytes, skipping")
-                continue
+        # Pages are independent, so overlap their uploads and compression.
+        # The semaphore and keep-alive client are per call because agents
+        # outlive event loops; the client is closed before the loop ends.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._new_client() as client:
+            results = await asyncio.gather(
+                *(
+                    self._process_page(page, page_idx, semaphore, client)
+                    for page_idx, page in enumerate(document.pages)
+                ),
+                return_exceptions=True
+            )
+        
+        for page_idx, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error(f"Page {page_idx} vision task failed: {result}")
+        
+        return document
+    
+    async def _process_page(
+        self,
+        page: Page,
+        page_idx: int,
+        semaphore: asyncio.Semaphore,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Run vision analysis for a single page and store the summary.
+        
+        Args:
+            page: Page to analyze
+            page_idx: Index of the page within the document (for logging)
+            semaphore: Bounds how many pages are analyzed concurrently
+            client: HTTP client for remote inference (see analyze_image_remote)
+        """
+        if not page.has_raw_image:
+            logger.warning(f"Page {page_idx} has no image bytes, skipping")
+            return
+        
+        async with semaphore:
+            await self._analyze_page(page, page_idx, client)
+    
+    async def _analyze_page(
+        self,
+        page: Page,
+        page_idx: int,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Analyze one page (remote first, local fallback) and store the summary.
+        
+        Args:
+            page: Page with raw image bytes
+            page_idx: Index of the page within the document (for logging)
+            client: HTTP client for remote inference (see analyze_image_remote)
+        """
+        try:
+            # Standard vision prompt
+            query = "Describe this document structure and content in detail."
+            
+            image_bytes = page.read_raw_image()
             
+            # Try remote inference first
             try:
-                # Standard vision prompt
-                query = "Describe this document structure and content in detail."
-                
-                # Try remote inference first
-                try:
-                    result = await self.analyze_image_remote(
-                        page.raw_image_bytes,
-                        query
-                    )
-                    logger.debug(f"Page {page_idx}: Remote analysis success")
-                    
-                except (httpx.ConnectError, httpx.TimeoutException, ConnectionError) as e:
-                    logger.warning(f"Cloud Brain unreachable: {e}. Falling back to local model.")
-                    result = await self._analyze_local(page.raw_image_bytes, query)
-                    logger.debug(f"Page {page_idx}: Local fallback used")
-                
-                # Store result in page metadata
-                if not page.metadata:
-                    page.metadata = {}
-                page.metadata['vision_summary'] = result
+                result = await self.analyze_image_remote(
+                    image_bytes,
+                    query,
+                    decoded=page.decoded_image,
+                    client=client
+                )
+                logger.debug(f"Page {page_idx}: Remote analysis success")
                 
-            except Exception as e:
-                logger.error(f"Page {page_idx} vision analysis failed: {e}")
-                if not page.metadata:
-                    page.metadata = {}
-                page.metadata['vision_summary'] = f"ERROR: {str(e)}"
-        
-        return document
+            except (httpx.ConnectError, httpx.TimeoutException, ConnectionError) as e:
+                logger.warning(f"Cloud Brain unreachable: {e}. Falling back to local model.")
+                result = await self._analyze_local(image_bytes, query)
+                logger.debug(f"Page {page_idx}: Local fallback used")
+            
+            # Store result in page metadata
+            if not page.metadata:
+                page.metadata = {}
+            page.metadata['vision_summary'] = result
+            
+        except Exception as e:
+            logger.error(f"Page {page_idx} vision analysis failed: {e}")
+            if not page.metadata:
+                page.metadata = {}
+            page.metadata['vision_summary'] = f"ERROR: {str(e)}"
     
-    def _compress_image(self, image_bytes: bytes) -> bytes:
+    def _compress_image(
+        self,
+        image_bytes: bytes,
+        decoded: Optional[Image.Image] = None
+    ) -> bytes:
         """Compress image to reduce transfer size.
         
         - Resize to max 1024px (maintaining aspect ratio)
@@ -111,44 +211,83 @@ class VisionAgent(BaseAgent):
         
         Args:
             image_bytes: Original image bytes
+            decoded: Optional already-decoded image for image_bytes (e.g.
+                page.decoded_image); used read-only to skip decoding
             
         Returns:
-            Compressed image bytes
+            Compressed image bytes, or image_bytes itself when a JPEG would
+            not be smaller
         """
+        if self._is_small_jpeg(image_bytes):
+            logger.debug("Image is already a small RGB JPEG, skipping compression")
+            return image_bytes
+        
+        if PYVIPS_AVAILABLE and decoded is None:
+            try:
+                return self._compress_image_vips(image_bytes)
+            except Exception as e:
+                logger.debug(f"libvips compression failed ({e}), retrying with PIL")
+        
         try:
-            # Load image
-            img = Image.open(BytesIO(image_bytes))
+            # Load image (shared decoded images are copied before resizing,
+            # since thumbnail works in place)
+            if decoded is None:
+                img = Image.open(BytesIO(image_bytes))
+            elif max(decoded.size) > self.max_image_size:
+                img = decoded.copy()
+            else:
+                img = decoded
             
-            # Resize if needed
-            if img.width > self.max_image_size or img.height > self.max_image_size:
-                # Calculate new dimensions maintaining aspect ratio
-                if img.width > img.height:
-                    new_width = self.max_image_size
-                    new_height = int(img.height * (self.max_image_size / img.width))
-                else:
-                    new_height = self.max_image_size
-                    new_width = int(img.width * (self.max_image_size / img.height))
-                
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                logger.debug(f"Resized image from {image_bytes.__len__()} to {new_width}x{new_height}")
+            # Resize if needed (thumbnail keeps aspect ratio and is a no-op
+            # when the image already fits)
+            original_size = img.size
+            img.thumbnail((self.max_image_size, self.max_image_size), Image.Resampling.LANCZOS)
+            if img.size != original_size:
+                logger.opt(lazy=True).debug(
+                    "Resized image from {} to {}",
+                    lambda: f"{original_size[0]}x{original_size[1]}",
+                    lambda: f"{img.width}x{img.height}"
+                )
             
-            # Convert RGBA to RGB if needed
-            if img.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
+            # Normalize to RGB. Document pages are almost always RGB or L, which
+            # need no (or a single) conversion; only images that actually carry
+            # alpha are composited over white.
+            if img.mode == 'RGB':
+                pass
+            elif img.mode == 'L' or (img.mode == 'P' and 'transparency' not in img.info):
+                img = img.convert('RGB')
+            elif img.mode in ('RGBA', 'LA', 'P'):
+                if img.mode != 'RGBA':
                     img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel('A'))
                 img = background
-            elif img.mode != 'RGB':
+            else:
                 img = img.convert('RGB')
             
-            # Compress to JPEG
-            output = BytesIO()
-            img.save(output, format='JPEG', quality=self.jpeg_quality, optimize=True)
+            # Compress to JPEG into the reusable per-thread buffer
+            output = self._get_compress_buffer()
+            img.save(output, format='JPEG', quality=self.jpeg_quality)
             compressed_bytes = output.getvalue()
             
-            reduction = (1 - len(compressed_bytes) / len(image_bytes)) * 100
-            logger.debug(f"Compressed image: {len(image_bytes)} → {len(compressed_bytes)} bytes ({reduction:.1f}% reduction)")
+            # Flat pages (mostly solid colour) can beat a plain JPEG as PNG;
+            # only then pay for the Huffman-optimizing pass
+            if len(compressed_bytes) >= len(image_bytes):
+                output = self._get_compress_buffer()
+                img.save(output, format='JPEG', quality=self.jpeg_quality, optimize=True)
+                compressed_bytes = output.getvalue()
+            
+            # Never upload more than we were given
+            if len(compressed_bytes) >= len(image_bytes):
+                logger.debug("JPEG is not smaller than the original, sending original")
+                return image_bytes
+            
+            logger.opt(lazy=True).debug(
+                "Compressed image: {} → {} bytes ({} reduction)",
+                lambda: len(image_bytes),
+                lambda: len(compressed_bytes),
+                lambda: f"{(1 - len(compressed_bytes) / len(image_bytes)) * 100:.1f}%"
+            )
             
             return compressed_bytes
             
@@ -156,16 +295,90 @@ class VisionAgent(BaseAgent):
             logger.warning(f"Image compression failed: {e}. Using original image.")
             return image_bytes
     
+    def _is_small_jpeg(self, image_bytes: bytes) -> bool:
+        """Check whether an image is already a small RGB JPEG within size limits.
+        
+        Only the JPEG header is parsed (Image.open is lazy), so this never
+        decodes pixel data.
+        
+        Args:
+            image_bytes: Original image bytes
+            
+        Returns:
+            True if the image can be uploaded without recompression
+        """
+        if len(image_bytes) >= _PASSTHROUGH_JPEG_BYTES or image_bytes[:3] != _JPEG_MAGIC:
+            return False
+        try:
+            with Image.open(BytesIO(image_bytes)) as img:
+                return img.mode == 'RGB' and max(img.size) <= self.max_image_size
+        except Exception:
+            return False
+    
+    def _compress_image_vips(self, image_bytes: bytes) -> bytes:
+        """libvips variant of _compress_image.
+        
+        thumbnail_buffer shrinks on load, so high-DPI scans are never fully
+        decoded at their original resolution.
+        
+        Args:
+            image_bytes: Original image bytes
+            
+        Returns:
+            Compressed image bytes
+        """
+        img = pyvips.Image.thumbnail_buffer(
+            image_bytes,
+            self.max_image_size,
+            height=self.max_image_size,
+            size='down'
+        )
+        
+        # Flatten alpha onto white and normalize to 3-band sRGB
+        if img.hasalpha():
+            img = img.flatten(background=[255, 255, 255])
+        if img.interpretation != 'srgb' or img.bands != 3:
+            img = img.colourspace('srgb')
+        
+        compressed_bytes = img.jpegsave_buffer(Q=self.jpeg_quality, keep='none')
+        if len(compressed_bytes) >= len(image_bytes):
+            compressed_bytes = img.jpegsave_buffer(
+                Q=self.jpeg_quality, keep='none', optimize_coding=True
+            )
+            if len(compressed_bytes) >= len(image_bytes):
+                return image_bytes
+        logger.opt(lazy=True).debug(
+            "Compressed image (libvips): {} → {} bytes",
+            lambda: len(image_bytes),
+            lambda: len(compressed_bytes)
+        )
+        return compressed_bytes
+    
+    def _get_compress_buffer(self) -> BytesIO:
+        """Return this thread's scratch BytesIO, rewound and emptied."""
+        buffer = getattr(self._compress_local, 'buffer', None)
+        if buffer is None:
+            buffer = BytesIO()
+            self._compress_local.buffer = buffer
+        buffer.seek(0)
+        buffer.truncate(0)
+        return buffer
+    
     async def analyze_image_remote(
         self,
         image_bytes: bytes,
-        query: str
+        query: str,
+        decoded: Optional[Image.Image] = None,
+        client: Optional[httpx.AsyncClient] = None
     ) -> str:
         """Analyze image using remote Cloud Brain.
         
         Args:
             image_bytes: Image data
             query: Analysis query
+            decoded: Optional already-decoded image for image_bytes
+            client: HTTP client to send with; defaults to the agent's shared
+                client (closed with aclose())
             
         Returns:
             Analysis result text
@@ -179,8 +392,11 @@ class VisionAgent(BaseAgent):
         if self.enable_cache:
             cache_key = self._generate_cache_key(image_bytes, query)
             if cache_key in self._cache:
+                self._cache_hits += 1
+                self._cache.move_to_end(cache_key)
                 logger.debug("Cache hit - returning cached result")
                 return self._cache[cache_key]
+            self._cache_misses += 1
         
         # Get tunnel URL
         status = self.tunnel.get_status()
@@ -205,79 +421,113 @@ class VisionAgent(BaseAgent):
         if security_mgr.should_block_request():
             raise ConnectionError("Requests blocked due to security concerns")
         
-        # Send request with retry
-        async with httpx.AsyncClient(timeout=self.timeout, verify=True) as client:  # SSL verification enabled
-            for attempt in range(self.max_retries):
-                try:
-                    logger.debug(f"Sending request to {endpoint} (attempt {attempt+1}/{self.max_retries})")
-                    
-                    # Compress image before sending
-                    compressed_bytes = self._compress_image(image_bytes)
-                    
-                    # Prepare multipart request with auth headers
-                    files = {'file': ('image.jpg', compressed_bytes, 'image/jpeg')}
-                    data = {'query': query}
-                    
-                    # Build headers with security token
-                    headers = {
-                        'Authorization': f'Bearer {self.api_key}',  # Legacy API key (backward compat)
-                    }
-                    
-                    
-                    # Use the auth header we already validated earlier
-                    headers.update(auth_header)
-                    
-                    response = await client.post(endpoint, files=files, data=data, headers=headers)
-                    
-                    # Handle authentication errors specifically
-                    if response.status_code == 401:
-                        logger.error("Authentication failed (401 Unauthorized)")
-                        security_mgr.record_auth_failure(endpoint, 401)
-                        
-                        # Trigger security alert
-                        from local_body.core.alerts import AlertManager, AlertSeverity, AlertComponent
-                        alert_mgr = AlertManager.get_instance()
-                        alert_mgr.create_alert(
-                            component=AlertComponent.SECURITY,
-                            severity=AlertSeverity.ERROR,
-                            message="Colab Brain authentication failed - check access token",
-                            metadata={"endpoint": endpoint}
-                        )
-                        
-                        raise httpx.HTTPStatusError(
-                            "Authentication failed",
-                            request=response.request,
-                            response=response
-                        )
-                    
-                    response.raise_for_status()
-                    
-                    # Extract result
-                    result_data = response.json()
-                    result = result_data.get('response', '')
-                    
-                    # Cache result
-                    if self.enable_cache:
-                        self._cache[cache_key] = result
-                    
-                    logger.success(f"Remote analysis successful ({len(result)} chars)")
-                    return result
+        # Compress image once before sending, off the event loop so other
+        # pages can make progress meanwhile
+        loop = asyncio.get_running_loop()
+        compressed_bytes = await loop.run_in_executor(
+            None, self._compress_image, image_bytes, decoded
+        )
+        
+        # Send request with retry over a keep-alive client
+        if client is None:
+            client = self._get_client()
+        for attempt in range(self.max_retries):
+            try:
+                logger.debug(f"Sending request to {endpoint} (attempt {attempt+1}/{self.max_retries})")
+                
+                # Prepare multipart request with auth headers
+                files = {'file': ('image.jpg', compressed_bytes, 'image/jpeg')}
+                data = {'query': query}
+                
+                # Build headers with security token
+                headers = {
+                    'Authorization': f'Bearer {self.api_key}',  # Legacy API key (backward compat)
+                }
+                
+                
+                # Use the auth header we already validated earlier
+                headers.update(auth_header)
+                
+                response = await client.post(endpoint, files=files, data=data, headers=headers)
+                
+                # Handle authentication errors specifically
+                if response.status_code == 401:
+                    logger.error("Authentication failed (401 Unauthorized)")
+                    security_mgr.record_auth_failure(endpoint, 401)
                     
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 401:
-                        # Don't retry auth failures
-                        raise
-                    logger.error(f"HTTP error {e.response.status_code}: {e}")
-                    if attempt == self.max_retries - 1:
-                        raise
+                    # Trigger security alert
+                    from local_body.core.alerts import AlertManager, AlertSeverity, AlertComponent
+                    alert_mgr = AlertManager.get_instance()
+                    alert_mgr.create_alert(
+                        component=AlertComponent.SECURITY,
+                        severity=AlertSeverity.ERROR,
+                        message="Colab Brain authentication failed - check access token",
+                        metadata={"endpoint": endpoint}
+                    )
                     
-                except (httpx.ConnectError, httpx.TimeoutException) as e:
-                    logger.warning(f"Connection attempt {attempt+1} failed: {e}")
-                    if attempt == self.max_retries - 1:
-                        raise
+                    raise httpx.HTTPStatusError(
+                        "Authentication failed",
+                        request=response.request,
+                        response=response
+                    )
+                
+                response.raise_for_status()
+                
+                # Extract result
+                result_data = response.json()
+                result = result_data.get('response', '')
+                
+                # Cache result
+                if self.enable_cache:
+                    self._store_cached(cache_key, result)
+                
+                logger.success(f"Remote analysis successful ({len(result)} chars)")
+                return result
+                
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 401:
+                    # Don't retry auth failures
+                    raise
+                logger.error(f"HTTP error {e.response.status_code}: {e}")
+                if attempt == self.max_retries - 1:
+                    raise
+                
+            except (httpx.ConnectError, httpx.TimeoutException) as e:
+                logger.warning(f"Connection attempt {attempt+1} failed: {e}")
+                if attempt == self.max_retries - 1:
+                    raise
         
         raise ConnectionError("All retry attempts failed")
     
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create a keep-alive AsyncClient for Cloud Brain requests."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            verify=True  # SSL verification enabled
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient for direct analyze_image_remote calls.
+        
+        process() uses its own client per call instead. Callers using this
+        shared client must close it with aclose() before their event loop
+        ends; a client found bound to another loop is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = self._new_client()
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
     async def _analyze_local(self, image_bytes: bytes, query: str) -> str:
         """Fallback to local Ollama vision model.
         
@@ -318,20 +568,44 @@ class VisionAgent(BaseAgent):
             return f"LOCAL_FALLBACK_ERROR: {str(e)}"
     
     def _generate_cache_key(self, image_bytes: bytes, query: str) -> str:
-        """Generate MD5 cache key for image+query pair.
+        """Generate cache key for image+query pair.
+        
+        Uses BLAKE3 when installed (several times faster on multi-MB page
+        renders), otherwise BLAKE2b with a 128-bit digest, which is faster
+        than MD5 in CPython. The key is only used for the in-process cache,
+        so cryptographic strength is not a concern.
         
         Args:
             image_bytes: Image data
             query: Query text
             
         Returns:
-            MD5 hash string
+            Hex digest string
         """
-        hasher = hashlib.md5()
-        hasher.update(image_bytes)
-        hasher.update(query.encode())
+        # Separator keeps (image, query) boundaries unambiguous
+        query_bytes = b'\x00' + query.encode('utf-8')
+        
+        if BLAKE3_AVAILABLE:
+            hasher = blake3.blake3(image_bytes)
+            hasher.update(query_bytes)
+            return hasher.hexdigest(length=16)
+        
+        if len(image_bytes) < _SMALL_IMAGE_BYTES:
+            # One update call is cheaper than two for small payloads
+            return hashlib.blake2b(image_bytes + query_bytes, digest_size=16).hexdigest()
+        
+        hasher = hashlib.blake2b(image_bytes, digest_size=16)
+        hasher.update(query_bytes)
         return hasher.hexdigest()
     
+    def _store_cached(self, cache_key: str, result: str) -> None:
+        """Insert a result, evicting the least recently used entry when full."""
+        if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+        elif len(self._cache) >= self.cache_max:
+            self._cache.popitem(last=False)
+        self._cache[cache_key] = result
+    
     def clear_cache(self):
         """Clear the inference cache."""
         self._cache.clear()
@@ -345,6 +619,7 @@ class VisionAgent(BaseAgent):
         """
         return {
             'entries': len(self._cache),
-            'hits': getattr(self, '_cache_hits', 0),
-            'misses': getattr(self, '_cache_misses', 0)
+            'max_entries': self.cache_max,
+            'hits': self._cache_hits,
+            'misses': self._cache_misses
         }
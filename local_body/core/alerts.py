@@ -4,10 +4,12 @@ This module provides a structured approach to managing alerts from various
 system components (hardware, services, network).
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 from loguru import logger
 
 
@@ -29,50 +31,79 @@ class AlertComponent(Enum):
     SECURITY = "security"  # Authentication, access control, security threats
 
 
-@dataclass
+# Enum values resolved once; alert_id and __str__ run for every alert logged
+_SEVERITY_STR = {s: s.value for s in AlertSeverity}
+_COMPONENT_STR = {c: c.value for c in AlertComponent}
+_SEV_UPPER = {s: s.value.upper() for s in AlertSeverity}
+_COMP_UPPER = {c: c.value.upper() for c in AlertComponent}
+
+# Messages shorter than this are interned; longer ones are usually unique
+_INTERN_MAX_LEN = 256
+
+
+@dataclass(eq=False, slots=True)
 class Alert:
     """Represents a system alert with metadata.
     
+    Alerts compare and hash by identity so AlertSystem can index them, and
+    use __slots__ to keep the per-alert footprint small. An indexed alert
+    keeps a reference to its AlertSystem so resolve() updates the indexes.
+    
     Attributes:
         severity: Alert severity level
         component: Component that generated the alert
         message: Human-readable alert description
-        timestamp: When the alert was created
+        timestamp: When the alert was created (nanoseconds since the epoch)
         alert_id: Unique identifier for the alert
         metadata: Additional context (optional)
         resolved: Whether the alert has been resolved
-        resolved_at: When the alert was resolved
+        resolved_at: When the alert was resolved (nanoseconds since the epoch)
     """
     severity: AlertSeverity
     component: AlertComponent
     message: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)
     alert_id: str = field(default="")
     metadata: Dict = field(default_factory=dict)
     resolved: bool = field(default=False)
-    resolved_at: Optional[datetime] = field(default=None)
+    resolved_at: Optional[int] = field(default=None)
+    _system: Optional["AlertSystem"] = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
         """Generate alert ID if not provided."""
         if not self.alert_id:
             # Create ID from timestamp + component + severity
             self.alert_id = (
-                f"{self.component.value}:"
-                f"{self.severity.value}:"
-                f"{int(self.timestamp.timestamp())}"
+                f"{_COMPONENT_STR[self.component]}:"
+                f"{_SEVERITY_STR[self.severity]}:"
+                f"{self.timestamp // 1_000_000_000}"
             )
     
+    @property
+    def datetime_ts(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
+    
+    @property
+    def resolved_datetime(self) -> Optional[datetime]:
+        """Resolution time as a local datetime, if resolved."""
+        if self.resolved_at is None:
+            return None
+        return datetime.fromtimestamp(self.resolved_at / 1e9)
+    
     def resolve(self):
         """Mark alert as resolved."""
         self.resolved = True
-        self.resolved_at = datetime.now()
+        self.resolved_at = time.time_ns()
+        if self._system is not None:
+            self._system._mark_resolved(self)
     
     def __str__(self) -> str:
         """String representation of alert."""
         status = "RESOLVED" if self.resolved else "ACTIVE"
         return (
-            f"[{status}] {self.severity.value.upper()} | "
-            f"{self.component.value.upper()} | "
+            f"[{status}] {_SEV_UPPER[self.severity]} | "
+            f"{_COMP_UPPER[self.component]} | "
             f"{self.message}"
         )
 
@@ -99,8 +130,20 @@ class AlertSystem:
     
     def __init__(self):
         """Initialize the alert system."""
-        self._alerts: List[Alert] = []
         self._max_history = 1000  # Keep last 1000 alerts
+        # History as an insertion-ordered dict used as a set: oldest-first
+        # iteration with O(1) removal of any alert on eviction
+        self._alerts: Dict[Alert, None] = {}
+        # Active alerts keyed by (component, severity, message) for O(1) dedup
+        self._active_index: Dict[Tuple[AlertComponent, AlertSeverity, str], Alert] = {}
+        # Secondary indexes (insertion-ordered dicts used as sets) so queries
+        # only touch matching alerts instead of walking the full history
+        self._by_component: Dict[AlertComponent, Dict[Alert, None]] = {}
+        self._by_severity: Dict[AlertSeverity, Dict[Alert, None]] = {}
+        self._active: Dict[Alert, None] = {}
+        self._resolved: Dict[Alert, None] = {}
+        # Running per-severity count of active alerts for get_alert_summary
+        self._active_counts: Dict[AlertSeverity, int] = dict.fromkeys(AlertSeverity, 0)
         logger.debug("AlertSystem initialized")
     
     def add_alert(
@@ -124,12 +167,18 @@ class AlertSystem:
         Returns:
             Created Alert instance (or existing if duplicate)
         """
+        # Periodic monitors repeat the same messages, so share one string object
+        if len(message) < _INTERN_MAX_LEN:
+            message = sys.intern(message)
+        
         # Check for duplicate active alerts
         existing = self._find_duplicate_active_alert(component, message, severity)
         
         if existing:
+            # Positional args: loguru only formats if DEBUG is actually emitted
             logger.debug(
-                f"Duplicate alert not added: {component.value} - {message}"
+                "Duplicate alert not added: {} - {}",
+                _COMPONENT_STR[component], message
             )
             return existing
         
@@ -141,7 +190,12 @@ class AlertSystem:
             metadata=metadata or {}
         )
         
-        self._alerts.append(alert)
+        # Maintain history limit
+        if len(self._alerts) >= self._max_history:
+            self._evict_oldest()
+        
+        self._alerts[alert] = None
+        self._index_alert(alert)
         
         # Log based on severity
         log_msg = f"Alert added: {alert}"
@@ -152,11 +206,6 @@ class AlertSystem:
         else:
             logger.info(log_msg)
         
-        # Maintain history limit
-        if len(self._alerts) > self._max_history:
-            # Remove oldest resolved alerts
-            self._alerts = [a for a in self._alerts if not a.resolved][-self._max_history:]
-        
         return alert
     
     def _find_duplicate_active_alert(
@@ -175,15 +224,75 @@ class AlertSystem:
         Returns:
             Existing alert if found, None otherwise
         """
+        return self._active_index.get((component, severity, message))
+    
+    def _index_alert(self, alert: Alert):
+        """Add an alert to the dedup and query indexes."""
+        alert._system = self
+        self._by_component.setdefault(alert.component, {})[alert] = None
+        self._by_severity.setdefault(alert.severity, {})[alert] = None
+        if alert.resolved:
+            self._resolved[alert] = None
+        else:
+            self._active[alert] = None
+            self._active_counts[alert.severity] += 1
+            self._active_index[(alert.component, alert.severity, alert.message)] = alert
+    
+    def _unindex_alert(self, alert: Alert):
+        """Remove an alert from every index."""
+        alert._system = None
+        self._by_component.get(alert.component, {}).pop(alert, None)
+        self._by_severity.get(alert.severity, {}).pop(alert, None)
+        self._resolved.pop(alert, None)
+        self._drop_active(alert)
+        key = (alert.component, alert.severity, alert.message)
+        if self._active_index.get(key) is alert:
+            del self._active_index[key]
+    
+    def _evict_oldest(self):
+        """Drop one alert from a full history, preferring resolved ones."""
+        pool = self._resolved or self._alerts
+        victim = next(iter(pool))
+        del self._alerts[victim]
+        self._unindex_alert(victim)
+    
+    def _rebuild_indexes(self):
+        """Rebuild all indexes from the current alert history."""
+        for alert in self._active:
+            alert._system = None
+        for alert in self._resolved:
+            alert._system = None
+        self._active_index = {}
+        self._by_component = {}
+        self._by_severity = {}
+        self._active = {}
+        self._resolved = {}
+        self._active_counts = dict.fromkeys(AlertSeverity, 0)
         for alert in self._alerts:
-            if (
-                not alert.resolved
-                and alert.component == component
-                and alert.message == message
-                and alert.severity == severity
-            ):
-                return alert
-        return None
+            self._index_alert(alert)
+    
+    def _drop_active(self, alert: Alert):
+        """Remove an alert from the active index, keeping the counts in step."""
+        if self._active.pop(alert, False) is None:
+            self._active_counts[alert.severity] -= 1
+    
+    def _mark_resolved(self, alert: Alert):
+        """Move a resolved alert from the active to the resolved indexes."""
+        self._drop_active(alert)
+        self._resolved[alert] = None
+        key = (alert.component, alert.severity, alert.message)
+        if self._active_index.get(key) is alert:
+            del self._active_index[key]
+    
+    @staticmethod
+    def _select(pools: Iterable[Dict[Alert, None]]) -> List[Alert]:
+        """Intersect index pools, iterating the smallest one.
+        
+        Every pool is insertion-ordered, so the result stays chronological.
+        """
+        pools = sorted(pools, key=len)
+        smallest, others = pools[0], pools[1:]
+        return [a for a in smallest if all(a in pool for pool in others)]
     
     def get_active_alerts(
         self,
@@ -199,16 +308,13 @@ class AlertSystem:
         Returns:
             List of active alerts matching criteria
         """
-        active = [a for a in self._alerts if not a.resolved]
-        
-        # Apply filters
+        pools = [self._active]
         if component:
-            active = [a for a in active if a.component == component]
-        
+            pools.append(self._by_component.get(component, {}))
         if severity:
-            active = [a for a in active if a.severity == severity]
+            pools.append(self._by_severity.get(severity, {}))
         
-        return active
+        return self._select(pools)
     
     def get_all_alerts(
         self,
@@ -226,19 +332,17 @@ class AlertSystem:
         Returns:
             List of alerts matching criteria
         """
-        alerts = self._alerts.copy()
-        
-        # Apply filters
+        pools = []
         if component:
-            alerts = [a for a in alerts if a.component == component]
-        
+            pools.append(self._by_component.get(component, {}))
         if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-        
+            pools.append(self._by_severity.get(severity, {}))
         if resolved is not None:
-            alerts = [a for a in alerts if a.resolved == resolved]
+            pools.append(self._resolved if resolved else self._active)
         
-        return alerts
+        if not pools:
+            return list(self._alerts)
+        return self._select(pools)
     
     def resolve_alerts(
         self,
@@ -253,22 +357,20 @@ class AlertSystem:
         """
         resolved_count = 0
         
-        for alert in self._alerts:
-            if alert.resolved:
-                continue
-            
-            should_resolve = True
-            
-            if component and alert.component != component:
-                should_resolve = False
-            
-            if message_pattern and message_pattern not in alert.message:
-                should_resolve = False
-            
-            if should_resolve:
-                alert.resolve()
-                resolved_count += 1
-                logger.debug(f"Resolved alert: {alert}")
+        # Only visit alerts that can match instead of the full history
+        if component:
+            candidates = self._select([self._active, self._by_component.get(component, {})])
+        else:
+            candidates = list(self._active)
+        
+        # Filter once up front so the resolve loop carries no pattern check
+        if message_pattern:
+            candidates = [a for a in candidates if message_pattern in a.message]
+        
+        for alert in candidates:
+            alert.resolve()  # moves it to the resolved index
+            resolved_count += 1
+            logger.debug("Resolved alert: {}", alert)
         
         if resolved_count > 0:
             logger.info(f"Resolved {resolved_count} alert(s)")
@@ -283,13 +385,18 @@ class AlertSystem:
             component: Optional filter - only clear alerts for this component
         """
         if component:
-            initial_count = len(self._alerts)
-            self._alerts = [a for a in self._alerts if a.component != component]
-            cleared = initial_count - len(self._alerts)
+            # The component index gives the victims directly; everything else
+            # keeps its index entries, so no full rebuild is needed
+            victims = self._by_component.pop(component, {})
+            for alert in victims:
+                del self._alerts[alert]
+                self._unindex_alert(alert)
+            cleared = len(victims)
             logger.info(f"Cleared {cleared} alert(s) for component {component.value}")
         else:
             cleared = len(self._alerts)
             self._alerts.clear()
+            self._rebuild_indexes()
             logger.info(f"Cleared all {cleared} alert(s)")
     
     def get_alert_summary(self) -> Dict[str, int]:
@@ -298,15 +405,15 @@ class AlertSystem:
         Returns:
             Dictionary with counts by severity and status
         """
-        active = self.get_active_alerts()
+        sev_active = self._active_counts
         
         return {
             "total_alerts": len(self._alerts),
-            "active_alerts": len(active),
-            "resolved_alerts": len([a for a in self._alerts if a.resolved]),
-            "critical_active": len([a for a in active if a.severity == AlertSeverity.CRITICAL]),
-            "warning_active": len([a for a in active if a.severity == AlertSeverity.WARNING]),
-            "info_active": len([a for a in active if a.severity == AlertSeverity.INFO])
+            "active_alerts": len(self._active),
+            "resolved_alerts": len(self._resolved),
+            "critical_active": sev_active[AlertSeverity.CRITICAL],
+            "warning_active": sev_active[AlertSeverity.WARNING],
+            "info_active": sev_active[AlertSeverity.INFO]
         }
     
     def get_critical_alerts(self) -> List[Alert]:
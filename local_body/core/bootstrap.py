@@ -10,9 +10,13 @@ Handles ordered initialization of all system components:
 Ensures the system is in a valid state before UI renders.
 """
 
+import asyncio
+import atexit
+import functools
 import os
-from pathlib import Path
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 
 from loguru import logger
 
@@ -22,6 +26,137 @@ from local_body.core.exceptions import (
     ConfigurationError,
     StartupError
 )
+from local_body.core.privacy import get_privacy_manager, PrivacyMode
+from local_body.core.security import get_security_manager
+
+# Resolved once at import instead of on every startup()/restart()
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# GPU detection (optional)
+try:
+    import GPUtil
+    GPUTIL_AVAILABLE = True
+except ImportError:
+    GPUTIL_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+# Directories created by step 4 (relative to the working directory)
+_REQUIRED_DIRS = (
+    "data/temp",
+    "data/logs",
+    "data/checkpoints",
+    "data/exports",
+    "logs",
+    "uploads",
+)
+
+# Separator line for the startup banner
+_BANNER = "=" * 80
+
+# Config file read by ConfigManager, and the env prefix of its overrides
+_CONFIG_PATH = "config.yaml"
+_CONFIG_ENV_PREFIX = "SOVEREIGN_"
+
+
+def _config_fingerprint() -> tuple:
+    """Fingerprint of the config inputs: config file mtime and SOVEREIGN_* env."""
+    try:
+        mtime = os.stat(_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    env = frozenset(
+        (key, value) for key, value in os.environ.items()
+        if key.startswith(_CONFIG_ENV_PREFIX)
+    )
+    return mtime, env
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(fingerprint: tuple) -> Any:
+    """Load configuration, reusing the last result while its inputs are unchanged."""
+    from local_body.core.config_manager import ConfigManager
+    
+    return ConfigManager(_CONFIG_PATH).load_config()
+
+
+# Shared HTTP client for health checks (created lazily, closed at exit)
+_health_client = None
+_health_client_lock = threading.Lock()
+
+
+def _get_health_client():
+    """Return the shared httpx.Client used for service health checks.
+    
+    Reusing one client keeps its connection pool across restarts instead
+    of building a new client and TCP connection for every probe.
+    """
+    global _health_client
+    if not HTTPX_AVAILABLE:
+        raise DependencyError(
+            "httpx is required for service health checks",
+            dependency="httpx"
+        )
+    if _health_client is None:
+        with _health_client_lock:
+            if _health_client is None:
+                _health_client = httpx.Client(
+                    timeout=5.0,
+                    limits=httpx.Limits(max_connections=4)
+                )
+                atexit.register(_health_client.close)
+    return _health_client
+
+
+# TCP connect timeout for service liveness probes
+_PROBE_TIMEOUT = 1.0
+
+
+async def _tcp_probe(host: str, port: int) -> Optional[str]:
+    """Check that a TCP connection to host:port can be opened.
+    
+    Returns:
+        None if the service is reachable, otherwise the error description
+    """
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=_PROBE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        return f"connection timed out after {_PROBE_TIMEOUT:.0f}s"
+    except OSError as e:
+        return str(e)
+    
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return None
+
+
+async def _probe_services(endpoints: Dict[str, Tuple[str, int]]) -> Dict[str, Optional[str]]:
+    """Probe all service endpoints concurrently.
+    
+    Args:
+        endpoints: Service name -> (host, port)
+        
+    Returns:
+        Service name -> None if reachable, else the error description
+    """
+    results = await asyncio.gather(
+        *(_tcp_probe(host, port) for host, port in endpoints.values())
+    )
+    return dict(zip(endpoints, results))
 
 
 class SystemBootstrap:
@@ -57,22 +192,18 @@ class SystemBootstrap:
             logger.info("System already initialized")
             return self.config
         
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("SOVEREIGN-DOC SYSTEM STARTUP")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         
         try:
             # Step 1: Configuration & Logging
             self._init_config_and_logging()
             
-            # Step 2: Hardware Validation
-            self._validate_hardware()
-            
-            # Step 3: Database Connectivity
-            self._check_database()
-            
-            # Step 4: Directory Structure
-            self._setup_directories()
+            # Steps 2-4: Hardware, Database, Directories
+            # Independent of each other, so overlap the network probe with
+            # the psutil/GPU queries and filesystem setup (loguru is thread-safe)
+            self._run_parallel_checks()
             
             # Step 5: Security Initialization
             self._init_security()
@@ -82,9 +213,9 @@ class SystemBootstrap:
             
             self.startup_complete = True
             
-            logger.success("=" * 80)
+            logger.success(_BANNER)
             logger.success("✅ SYSTEM STARTUP COMPLETE")
-            logger.success("=" * 80)
+            logger.success(_BANNER)
             
             return self.config
             
@@ -102,12 +233,10 @@ class SystemBootstrap:
         logger.info("Step 1/6: Initializing Configuration & Logging...")
         
         try:
-            from local_body.core.config_manager import ConfigManager
             from local_body.core.logging_setup import setup_logging
             
-            # Load configuration
-            config_mgr = ConfigManager()
-            self.config = config_mgr.load_config()
+            # Load configuration (re-parsed only if config.yaml or env changed)
+            self.config = _load_config_cached(_config_fingerprint()).model_copy()
             
             logger.info(f"✓ Configuration loaded (profile: {self.config.profile})")
             
@@ -126,6 +255,24 @@ class SystemBootstrap:
                 startup_stage="config_and_logging"
             )
     
+    def _run_parallel_checks(self) -> None:
+        """Run steps 2-4 concurrently.
+        
+        Every step finishes before returning; the first failure in step
+        order is re-raised so errors match the sequential startup.
+        
+        Raises:
+            ResourceError: If hardware insufficient
+            StartupError: If directory creation fails
+        """
+        steps = (self._validate_hardware, self._check_database, self._setup_directories)
+        
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step) for step in steps]
+        
+        for future in futures:
+            future.result()
+    
     def _validate_hardware(self) -> None:
         """Step 2: Validate hardware resources.
         
@@ -135,7 +282,11 @@ class SystemBootstrap:
         logger.info("Step 2/6: Validating Hardware Resources...")
         
         try:
-            import psutil
+            if not PSUTIL_AVAILABLE:
+                raise DependencyError(
+                    "psutil is required for hardware validation",
+                    dependency="psutil"
+                )
             
             # Check available RAM
             ram_info = psutil.virtual_memory()
@@ -164,8 +315,7 @@ class SystemBootstrap:
             
             # Check GPU (optional)
             try:
-                import GPUtil
-                gpus = GPUtil.getGPUs()
+                gpus = GPUtil.getGPUs() if GPUTIL_AVAILABLE else []
                 if gpus:
                     for gpu in gpus:
                         logger.info(f"  GPU: {gpu.name} ({gpu.memoryTotal} MB)")
@@ -191,14 +341,18 @@ class SystemBootstrap:
         logger.info("Step 3/6: Checking Database Connectivity...")
         
         try:
-            from local_body.database.vector_store import DocumentVectorStore
-            import httpx
-            
             # Try to ping Qdrant
             qdrant_url = f"http://{self.config.qdrant_host}:{self.config.qdrant_port}"
+            endpoints = {"qdrant": (self.config.qdrant_host, self.config.qdrant_port)}
             
             try:
-                response = httpx.get(f"{qdrant_url}/healthz", timeout=5.0)
+                # Cheap TCP liveness probe first so a stopped service fails in
+                # ~1s; the HTTP health endpoint is only queried once it answers
+                probe = asyncio.run(_probe_services(endpoints))
+                if probe["qdrant"] is not None:
+                    raise Exception(probe["qdrant"])
+                
+                response = _get_health_client().get(f"{qdrant_url}/healthz")
                 if response.status_code == 200:
                     logger.info(f"✓ Qdrant connected: {qdrant_url}")
                 else:
@@ -222,18 +376,10 @@ class SystemBootstrap:
         logger.info("Step 4/6: Setting Up Directory Structure...")
         
         try:
-            required_dirs = [
-                "data/temp",
-                "data/logs",
-                "data/checkpoints",
-                "data/exports",
-                "logs",
-                "uploads"
-            ]
-            
-            for dir_path in required_dirs:
-                path = Path(dir_path)
-                path.mkdir(parents=True, exist_ok=True)
+            for dir_path in _REQUIRED_DIRS:
+                # A stat is enough on a warm system; only mkdir what is missing
+                if not os.path.isdir(dir_path):
+                    os.makedirs(dir_path, exist_ok=True)
                 logger.debug(f"  ✓ {dir_path}")
             
             logger.info("✓ Directory structure verified")
@@ -253,8 +399,6 @@ class SystemBootstrap:
         logger.info("Step 5/6: Initializing Security...")
         
         try:
-            from local_body.core.security import get_security_manager
-            
             security_mgr = get_security_manager()
             
             # Load access token from config
@@ -287,8 +431,6 @@ class SystemBootstrap:
         logger.info("Step 6/6: Initializing Privacy Manager...")
         
         try:
-            from local_body.core.privacy import get_privacy_manager, PrivacyMode
-            
             privacy_mgr = get_privacy_manager()
             
             # Set privacy mode based on config (default: STANDARD)
@@ -330,20 +472,16 @@ class SystemBootstrap:
         return self.startup(force_reload=True)
 
 
-# Global bootstrap instance
-_bootstrap_instance: Optional[SystemBootstrap] = None
-
-
+@functools.cache
 def get_bootstrap() -> SystemBootstrap:
     """Get global bootstrap instance.
     
+    Use get_bootstrap.cache_clear() to drop the singleton.
+    
     Returns:
         SystemBootstrap singleton
     """
-    global _bootstrap_instance
-    if _bootstrap_instance is None:
-        _bootstrap_instance = SystemBootstrap()
-    return _bootstrap_instance
+    return SystemBootstrap()
 
 
 def initialize_system() -> Any:
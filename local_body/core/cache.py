@@ -4,34 +4,237 @@ Uses diskcache for persistent storage to survive application restarts.
 Caches OCR, layout, and vision results by file hash + stage.
 """
 
+import atexit
 import hashlib
+import json
+import mmap
+import os
 import pickle
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import timedelta
 
-from diskcache import Cache
+from diskcache import Cache, Disk
+from diskcache.core import UNKNOWN
 from loguru import logger
 
+from local_body.core.config_manager import parse_bool
 from local_body.core.privacy import get_privacy_manager
 
+# Optional: compact serialization for plain-data stage results
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Optional: SIMD/multithreaded hashing for cache keys (falls back to SHA256)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Optional: fast canonical JSON for key parameters (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: compression for large cached values
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# hashlib.file_digest is only available on Python 3.11+
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+# Read size for the fallback loop scales with the file (size/64), clamped
+_HASH_CHUNK_MIN = 64 << 10
+_HASH_CHUNK_MAX = 4 << 20
+
+# Cache-key hash algorithm, selected via SOVEREIGN_HASH=blake3|sha256.
+# Keys carry a prefix so entries from different algorithms never collide.
+_HASH_ENV = "SOVEREIGN_HASH"
+_KEY_PREFIX = {"blake3": "b3:", "sha256": "s2:"}
+
+# Readahead hints for content hashing (Linux/POSIX only)
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+_HAS_MADVISE = hasattr(mmap, 'MADV_SEQUENTIAL')
+
+# Files above this size are hashed through mmap in one update() call
+_MMAP_MIN_BYTES = 4 << 20
+
+# Size of the in-process front cache (0 disables it)
+_MEM_CACHE_ENV = "SOVEREIGN_MEM_CACHE"
+_MEM_CACHE_DEFAULT = 256
+
+# SQLite tuning for concurrent readers: 64 MB page cache and 256 MB mmap by
+# default (SOVEREIGN_CACHE_SQLITE_CACHE_KB / SOVEREIGN_CACHE_SQLITE_MMAP_MB).
+# WAL + synchronous=NORMAL are diskcache's defaults but pinned explicitly.
+_SQLITE_CACHE_KB_ENV = "SOVEREIGN_CACHE_SQLITE_CACHE_KB"
+_SQLITE_MMAP_MB_ENV = "SOVEREIGN_CACHE_SQLITE_MMAP_MB"
+
+
+def _sqlite_settings() -> dict:
+    """diskcache SQLite settings, with env overrides for the memory knobs."""
+    return {
+        # Negative cache_size is in KiB rather than pages
+        'sqlite_cache_size': -int(os.getenv(_SQLITE_CACHE_KB_ENV, "64000")),
+        'sqlite_mmap_size': int(os.getenv(_SQLITE_MMAP_MB_ENV, "256")) << 20,
+        'sqlite_journal_mode': 'wal',
+        'sqlite_synchronous': 1,  # NORMAL
+    }
+
+
+# Write-behind audit trail: bounded queue drained by a daemon thread
+_AUDIT_QUEUE_SIZE = 10000
+_AUDIT_FLUSH_INTERVAL = 0.1  # seconds a burst may queue before it is written
+
+# loguru level number for INFO; per-op logs are skipped below it
+_INFO_LEVEL = 20
+
+# Force full content hashing for cache keys (CacheManager has no config)
+_STRICT_HASH_ENV = "SOVEREIGN_CACHE_STRICT_HASH"
+
+
+def _info_enabled() -> bool:
+    """True if some loguru sink accepts INFO (avoids formatting dead logs)."""
+    return logger._core.min_level <= _INFO_LEVEL
+
+
+def _canonical_params(params: dict) -> bytes:
+    """Deterministic byte encoding of cache-key parameters (sorted keys)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(params, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(
+            params, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+        ).encode()
+    except (TypeError, ValueError):
+        # Values JSON can't represent: fall back to their repr
+        return str(sorted(params.items())).encode()
+
+
+# Format markers prefixed to values written by SerializingDisk
+_FMT_MSGPACK = b'\x00M'
+_FMT_PICKLE = b'\x00P'
+_FMT_ZSTD = b'\x00Z'
+
+# Serialized values above this size are zstd-compressed (level 3)
+_COMPRESS_MIN_BYTES = 16 * 1024
+_ZSTD_LEVEL = 3
+
+# zstd (de)compressor contexts are not thread-safe; keep one pair per thread
+_zstd_local = threading.local()
+
+
+def _zstd_compressor():
+    cctx = getattr(_zstd_local, 'cctx', None)
+    if cctx is None:
+        cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return cctx
+
+
+def _zstd_decompressor():
+    dctx = getattr(_zstd_local, 'dctx', None)
+    if dctx is None:
+        dctx = _zstd_local.dctx = zstandard.ZstdDecompressor()
+    return dctx
+
+
+def _serialize(value: Any) -> bytes:
+    """Serialize a cache value, preferring msgpack over pickle.
+    
+    msgpack runs with strict_types so tuples, subclasses and arbitrary
+    objects are rejected rather than silently converted; those fall back
+    to pickle and round-trip exactly.
+    """
+    blob = None
+    if MSGPACK_AVAILABLE:
+        try:
+            blob = _FMT_MSGPACK + msgpack.packb(value, use_bin_type=True, strict_types=True)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    if blob is None:
+        blob = _FMT_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    # Large OCR/vision results shrink 2-4x, so more entries fit in the 1 GB budget
+    if ZSTD_AVAILABLE and len(blob) > _COMPRESS_MIN_BYTES:
+        blob = _FMT_ZSTD + _zstd_compressor().compress(blob)
+    return blob
+
+
+def _deserialize(blob: bytes) -> Any:
+    """Inverse of _serialize; unmarked bytes are returned unchanged."""
+    marker = blob[:2]
+    if marker == _FMT_ZSTD:
+        blob = _zstd_decompressor().decompress(blob[2:])
+        marker = blob[:2]
+    if marker == _FMT_MSGPACK:
+        return msgpack.unpackb(blob[2:], raw=False, strict_map_key=False)
+    if marker == _FMT_PICKLE:
+        return pickle.loads(blob[2:])
+    return blob
+
+
+def _short_key(key: str) -> str:
+    """Shorten a 'stage:prefix:digest' key for logs and audit entries."""
+    head, _, digest = key.rpartition(':')
+    return f"{head}:{digest[:12]}" if head else key[:16]
+
+
+class SerializingDisk(Disk):
+    """diskcache Disk storing msgpack for JSON-like values, pickle otherwise.
+    
+    OCR/layout results are mostly dicts, lists and numbers, which msgpack
+    encodes smaller and faster than pickle; large values are additionally
+    zstd-compressed when zstandard is installed. Entries written by the default
+    Disk (plain pickle) are still readable.
+    """
+    
+    def store(self, value, read, key=UNKNOWN):
+        if not read:
+            value = _serialize(value)
+        return super().store(value, read, key=key)
+    
+    def fetch(self, mode, filename, value, read):
+        value = super().fetch(mode, filename, value, read)
+        if not read and isinstance(value, bytes):
+            return _deserialize(value)
+        return value
+
 
 class CacheManager:
     """Manages persistent caching of processing results.
     
     Features:
     - Disk-based cache (survives restarts)
-    - Content-based keys (file hash + stage)
+    - In-memory LRU front cache for hot keys
+    - File-identity keys (path/mtime/size or content hash + stage)
     - Automatic expiration
     - Cache statistics
     - Privacy-safe (no PII in keys)
     """
     
     _instance = None
+    _lock = threading.Lock()  # guards instance creation and __init__
     
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     def __init__(self, cache_dir: str = "data/cache"):
@@ -40,40 +243,90 @@ class CacheManager:
         Args:
             cache_dir: Directory for cache storage
         """
-        if not hasattr(self, '_initialized'):
-            self.cache_dir = Path(cache_dir)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Initialize diskcache
-            self.cache = Cache(
-                directory=str(self.cache_dir),
-                size_limit=1024 * 1024 * 1024,  # 1GB max
-                eviction_policy='least-recently-used'
-            )
-            
-            # Statistics
-            self.hits = 0
-            self.misses = 0
-            
-            self._initialized = True
-            logger.info(f"CacheManager initialized: {self.cache_dir}")
+        if hasattr(self, '_initialized'):
+            return
+        
+        # Double-checked: only one thread mkdirs and opens the SQLite cache
+        with self._lock:
+            if not hasattr(self, '_initialized'):
+                self.cache_dir = Path(cache_dir)
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                
+                # Initialize diskcache
+                self.cache = Cache(
+                    directory=str(self.cache_dir),
+                    size_limit=1024 * 1024 * 1024,  # 1GB max
+                    eviction_policy='least-recently-used',
+                    disk=SerializingDisk,
+                    tag_index=True,  # entries are tagged with their stage
+                    **_sqlite_settings()
+                )
+                
+                # Force full content hashing for every key (integrity-critical setups)
+                self.strict_hash = parse_bool(os.getenv(_STRICT_HASH_ENV, ""))
+                
+                # Cache-key hash algorithm (BLAKE3 by default when installed)
+                self.hash_algo = os.getenv(
+                    _HASH_ENV, "blake3" if BLAKE3_AVAILABLE else "sha256"
+                ).lower()
+                if self.hash_algo not in _KEY_PREFIX or (
+                    self.hash_algo == "blake3" and not BLAKE3_AVAILABLE
+                ):
+                    logger.warning(f"Cache hash '{self.hash_algo}' unavailable, using sha256")
+                    self.hash_algo = "sha256"
+                
+                # Per-thread read buffer for the non-file_digest hash path
+                self._hash_local = threading.local()
+                
+                # In-memory LRU front cache: key -> (serialized value, expire_at). A key is only
+                # admitted on its second disk hit, so one-shot batch scans do not
+                # evict the hot set (LRU-2 style; _mem_seen remembers first hits)
+                self._mem_max = int(os.getenv(_MEM_CACHE_ENV, str(_MEM_CACHE_DEFAULT)))
+                self._mem: OrderedDict = OrderedDict()
+                self._mem_seen: OrderedDict = OrderedDict()
+                self._mem_lock = threading.Lock()
+                
+                # Audit entries are queued and written off the get/set path
+                self._audit_q: queue.Queue = queue.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+                self._audit_worker = threading.Thread(
+                    target=self._audit_loop, name="cache-audit", daemon=True
+                )
+                self._audit_worker.start()
+                atexit.register(self._flush_audit)
+                
+                # Statistics
+                self.hits = 0
+                self.misses = 0
+                self.mem_hits = 0
+                
+                self._initialized = True
+                logger.info(f"CacheManager initialized: {self.cache_dir}")
     
     @classmethod
     def get_instance(cls) -> "CacheManager":
         """Get singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        instance = cls._instance
+        if instance is None or not hasattr(instance, '_initialized'):
+            # __new__ and __init__ are lock-guarded; this waits for a
+            # concurrent initialization instead of returning a half-built object
+            instance = cls()
+        return instance
     
     def generate_key(
         self,
         file_path: str,
         stage: str,
-        additional_params: Optional[dict] = None
+        additional_params: Optional[dict] = None,
+        fast_key: bool = True
     ) -> str:
-        """Generate cache key based on file content and processing stage.
+        """Generate cache key based on file identity and processing stage.
         
-        Uses SHA256 of file content + stage name to ensure:
+        By default the key is a hash of the file's absolute path, mtime and
+        size (one stat call); with fast_key=False or strict_hash set, the
+        full file content is hashed instead. The hash is BLAKE3 or SHA256
+        (see hash_algo), prefixed with 'b3:' or 's2:', and the key starts
+        with the stage name ('ocr:s2:...') so entries can be cleared per
+        stage. Either way:
         - Same file = same key
         - Modified file = different key
         - Different stages = different keys
@@ -82,37 +335,126 @@ class CacheManager:
             file_path: Path to file
             stage: Processing stage (e.g., 'ocr', 'layout', 'vision')
             additional_params: Optional parameters affecting output
+            fast_key: Use the stat fingerprint instead of hashing content
             
         Returns:
-            Cache key (SHA256 hash)
+            Cache key ('stage:' + algorithm prefix + hex digest)
         """
         try:
-            # Hash file content
-            hasher = hashlib.sha256()
-            
-            with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hasher.update(chunk)
+            if fast_key and not self.strict_hash:
+                # O(1): fingerprint the file instead of reading it
+                st = os.stat(file_path)
+                hasher = self._new_hasher()
+                hasher.update(
+                    f"{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}|".encode()
+                )
+            else:
+                hasher = self._hash_file(file_path)
             
             # Add stage
             hasher.update(stage.encode())
             
             # Add additional params if provided
             if additional_params:
-                # Sort keys for consistency
-                param_str = str(sorted(additional_params.items()))
-                hasher.update(param_str.encode())
+                hasher.update(_canonical_params(additional_params))
             
-            cache_key = hasher.hexdigest()
-            logger.debug(f"Generated cache key: {cache_key[:16]}... for {stage}")
+            cache_key = f"{stage}:{_KEY_PREFIX[self.hash_algo]}{hasher.hexdigest()}"
+            logger.debug(f"Generated cache key: {_short_key(cache_key)}...")
             
             return cache_key
             
         except Exception as e:
             logger.error(f"Failed to generate cache key: {e}")
             # Return unique key to avoid conflicts
-            return f"error_{stage}_{hash(file_path)}"
+            return f"{stage}:error_{hash(file_path)}"
+    
+    def generate_keys(
+        self,
+        files: List[Tuple[str, str, Optional[dict]]],
+        fast_key: bool = True
+    ) -> List[str]:
+        """Generate cache keys for a batch of files concurrently.
+        
+        Content hashing releases the GIL on large update() calls, so hashing
+        N files on a thread pool scales with the number of cores.
+        
+        Args:
+            files: (file_path, stage, additional_params) tuples
+            fast_key: Passed through to generate_key
+            
+        Returns:
+            Cache keys in the same order as files
+        """
+        if len(files) <= 1:
+            return [self.generate_key(*item, fast_key=fast_key) for item in files]
+        
+        workers = min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda item: self.generate_key(*item, fast_key=fast_key), files
+            ))
+    
+    def _new_hasher(self):
+        """Return an empty hasher for the configured algorithm."""
+        if self.hash_algo == "blake3":
+            return blake3.blake3()
+        return hashlib.sha256()
+    
+    def _hash_file(self, file_path: str):
+        """Return a hasher fed with the file's content."""
+        if self.hash_algo == "blake3":
+            # Memory-mapped, SIMD and multithreaded inside blake3
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher
+        
+        with open(file_path, 'rb') as f:
+            fd = f.fileno()
+            if _HAS_FADVISE:
+                # Strictly sequential read: let the kernel read ahead further
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            size = os.fstat(fd).st_size
+            if size > _MMAP_MIN_BYTES:
+                # Zero-copy: one GIL-released update over the page-cache mapping
+                hasher = hashlib.sha256()
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if _HAS_MADVISE:
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+            elif _HAS_FILE_DIGEST:
+                # Read + update loop runs in C (Python 3.11+)
+                hasher = hashlib.file_digest(f, 'sha256')
+            else:
+                hasher = hashlib.sha256()
+                self._hash_into(f, hasher, size)
+            
+            if _HAS_FADVISE:
+                # Hashed once; don't let it push hotter pages out of the page cache
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return hasher
+    
+    def _hash_into(self, f, hasher, size: int) -> None:
+        """Feed an open binary file into hasher through a reused buffer.
+        
+        The buffer is size/64 rounded up to a power of two and clamped to
+        64 KiB-4 MiB, so small files don't pay for a large allocation and
+        big files still get few, GIL-releasing update() calls. Buffers are
+        pooled per thread by size, and readinto() fills them in place.
+        """
+        bufsize = min(max(size // 64, _HASH_CHUNK_MIN), _HASH_CHUNK_MAX)
+        bufsize = 1 << (bufsize - 1).bit_length()
+        
+        pool = getattr(self._hash_local, 'bufs', None)
+        if pool is None:
+            pool = self._hash_local.bufs = {}
+        buf = pool.get(bufsize)
+        if buf is None:
+            buf = pool[bufsize] = bytearray(bufsize)
+        view = memoryview(buf)
+        
+        while n := f.readinto(buf):
+            hasher.update(view[:n])
     
     def get(self, key: str) -> Optional[Any]:
         """Retrieve value from cache.
@@ -124,34 +466,183 @@ class CacheManager:
             Cached value if exists, None otherwise
         """
         try:
-            value = self.cache.get(key)
+            value = self._mem_get(key)
+            
+            if value is None:
+                value, expire_at = self.cache.get(key, expire_time=True)
+                if value is not None:
+                    self._mem_admit(key, value, expire_at)
             
             if value is not None:
                 self.hits += 1
-                logger.info(f"Cache HIT: {key[:16]}... (hits: {self.hits})")
+                if _info_enabled():
+                    logger.info(f"Cache HIT: {_short_key(key)}... (hits: {self.hits})")
                 
                 # Audit cache hit
-                get_privacy_manager().audit_log(
-                    action="cache_hit",
-                    resource="cache",
-                    resource_id=key[:16]
-                )
+                self._audit("cache_hit", key)
                 
                 return value
             else:
                 self.misses += 1
-                logger.debug(f"Cache MISS: {key[:16]}... (misses: {self.misses})")
+                logger.debug(f"Cache MISS: {_short_key(key)}... (misses: {self.misses})")
                 return None
                 
         except Exception as e:
             logger.error(f"Cache get error: {e}")
             return None
     
+    def prefetch(
+        self,
+        files: Iterable[str],
+        stages: Iterable[str],
+        max_workers: int = 8
+    ) -> Dict[Tuple[str, str], Any]:
+        """Look up every (file, stage) entry concurrently and warm the front cache.
+        
+        Disk lookups for a known batch overlap on a thread pool; hits are
+        promoted straight into the in-memory LRU so the following get()
+        calls are served from memory.
+        
+        Args:
+            files: Document paths
+            stages: Processing stages to look up for each file
+            max_workers: Thread pool size
+            
+        Returns:
+            (file_path, stage) -> cached value (None if absent)
+        """
+        pairs = [(f, stage) for f in files for stage in stages]
+        if not pairs:
+            return {}
+        
+        def lookup(pair: Tuple[str, str]) -> Any:
+            key = self.generate_key(*pair)
+            value = self._mem_get(key)
+            if value is None:
+                value, expire_at = self.cache.get(key, expire_time=True)
+                if value is not None:
+                    self._mem_admit(key, value, expire_at, promote=True)
+            return value
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+                results = dict(zip(pairs, executor.map(lookup, pairs)))
+        except Exception as e:
+            logger.error(f"Cache prefetch error: {e}")
+            return {}
+        
+        logger.debug(
+            f"Cache prefetch: {sum(v is not None for v in results.values())}/{len(pairs)} hits"
+        )
+        return results
+    
+    def _audit(self, action: str, key: str, metadata: Optional[dict] = None) -> None:
+        """Queue an audit entry; dropped if the queue is full (best-effort)."""
+        try:
+            self._audit_q.put_nowait((action, _short_key(key), metadata))
+        except queue.Full:
+            pass
+    
+    def _audit_loop(self) -> None:
+        """Background writer: sleeps on the queue, then flushes each burst in one batch."""
+        while True:
+            first = self._audit_q.get()  # blocks while the cache is idle
+            # Give the rest of a burst a moment to queue up behind it
+            time.sleep(_AUDIT_FLUSH_INTERVAL)
+            self._flush_audit(first)
+    
+    def _flush_audit(self, first: Optional[Tuple] = None) -> None:
+        """Write every queued audit entry (after first, if given) to the audit log."""
+        batch = [first] if first is not None else []
+        while True:
+            try:
+                batch.append(self._audit_q.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        
+        privacy = get_privacy_manager()
+        for action, resource_id, metadata in batch:
+            try:
+                privacy.audit_log(
+                    action=action,
+                    resource="cache",
+                    resource_id=resource_id,
+                    metadata=metadata
+                )
+            except Exception as e:
+                logger.error(f"Cache audit error: {e}")
+    
+    def _mem_get(self, key: str) -> Optional[Any]:
+        """Look up a key in the front cache, dropping it if expired.
+        
+        Every hit deserializes a fresh copy, as a disk hit would, so callers
+        that mutate cached results (e.g. OCR filling layout regions) never
+        change what later hits see.
+        """
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return None
+            blob, expire_at = entry
+            if expire_at is not None and expire_at <= time.time():
+                del self._mem[key]
+                return None
+            self._mem.move_to_end(key)
+            self.mem_hits += 1
+        return _deserialize(blob)
+    
+    def _mem_admit(
+        self,
+        key: str,
+        value: Any,
+        expire_at: Optional[float],
+        promote: bool = False
+    ) -> None:
+        """Record a disk hit; promote the key into memory on its second hit.
+        
+        promote=True admits immediately (used by prefetch, whose entries are
+        known to be read next).
+        """
+        if self._mem_max <= 0:
+            return
+        with self._mem_lock:
+            if self._mem_seen.pop(key, False) is None or promote:
+                # Stored serialized: the caller is about to receive (and may
+                # mutate) value itself
+                self._mem[key] = (_serialize(value), expire_at)
+                if len(self._mem) > self._mem_max:
+                    self._mem.popitem(last=False)
+            else:
+                self._mem_seen[key] = None
+                if len(self._mem_seen) > self._mem_max:
+                    self._mem_seen.popitem(last=False)
+    
+    def _mem_discard(self, key: Optional[str] = None) -> None:
+        """Drop one key (or everything, if key is None) from the front cache."""
+        with self._mem_lock:
+            if key is None:
+                self._mem.clear()
+                self._mem_seen.clear()
+            else:
+                self._mem.pop(key, None)
+                self._mem_seen.pop(key, None)
+    
+    def _mem_discard_stage(self, stage: str) -> None:
+        """Drop one stage's keys from the front cache."""
+        prefix = f"{stage}:"
+        with self._mem_lock:
+            for entries in (self._mem, self._mem_seen):
+                for key in [k for k in entries if k.startswith(prefix)]:
+                    del entries[key]
+    
     def set(
         self,
         key: str,
         value: Any,
-        expire: int = 86400  # 24 hours default
+        expire: int = 86400,  # 24 hours default
+        stage: Optional[str] = None
     ) -> bool:
         """Store value in cache.
         
@@ -159,24 +650,24 @@ class CacheManager:
             key: Cache key
             value: Value to cache
             expire: Expiration time in seconds (default: 24h)
+            stage: Tag for clear_by_stage (default: the key's stage prefix)
             
         Returns:
             True if stored successfully
         """
         try:
-            # Store with expiration
-            success = self.cache.set(key, value, expire=expire)
+            # Store with expiration; a stale in-memory copy must not outlive it
+            self._mem_discard(key)
+            if stage is None:
+                stage = key.partition(':')[0] if ':' in key else None
+            success = self.cache.set(key, value, expire=expire, tag=stage)
             
             if success:
-                logger.info(f"Cache SET: {key[:16]}... (expires in {expire}s)")
+                if _info_enabled():
+                    logger.info(f"Cache SET: {_short_key(key)}... (expires in {expire}s)")
                 
                 # Audit cache set
-                get_privacy_manager().audit_log(
-                    action="cache_set",
-                    resource="cache",
-                    resource_id=key[:16],
-                    metadata={"expire": expire}
-                )
+                self._audit("cache_set", key, {"expire": expire})
             
             return success
             
@@ -194,10 +685,13 @@ class CacheManager:
             True if removed
         """
         try:
+            self._mem_discard(key)
             success = self.cache.delete(key)
             
             if success:
-                logger.info(f"Cache INVALIDATE: {key[:16]}...")
+                if _info_enabled():
+                    logger.info(f"Cache INVALIDATE: {_short_key(key)}...")
+                self._audit("cache_invalidate", key)
             
             return success
             
@@ -215,16 +709,10 @@ class CacheManager:
             Number of entries removed
         """
         try:
-            # Iterate through cache and remove matching entries
-            removed = 0
-            
-            # Note: diskcache doesn't have pattern matching,
-            # so we need to track stage in metadata or use key convention
-            # For now, we clear entire cache
-            logger.warning(f"clear_by_stage not fully implemented - clearing entire cache")
-            
-            self.cache.clear()
-            removed = 1
+            # Tag-scoped delete runs as one indexed SQLite query; other
+            # stages keep their entries
+            removed = self.cache.evict(tag=stage)
+            self._mem_discard_stage(stage)
             
             logger.info(f"Cleared cache for stage: {stage} ({removed} entries)")
             return removed
@@ -237,11 +725,13 @@ class CacheManager:
         """Clear entire cache."""
         try:
             self.cache.clear()
+            self._mem_discard()
             logger.info("Cache cleared completely")
             
             # Reset stats
             self.hits = 0
             self.misses = 0
+            self.mem_hits = 0
             
         except Exception as e:
             logger.error(f"Cache clear all error: {e}")
@@ -259,6 +749,7 @@ class CacheManager:
             return {
                 "hits": self.hits,
                 "misses": self.misses,
+                "memory_hits": self.mem_hits,
                 "hit_rate": f"{hit_rate:.1f}%",
                 "size_bytes": self.cache.volume(),
                 "entry_count": len(self.cache),
@@ -317,7 +808,23 @@ def cache_document_stage(
     """
     cache = get_cache_manager()
     key = cache.generate_key(file_path, stage)
-    return cache.set(key, result, expire=expire_hours * 3600)
+    return cache.set(key, result, expire=expire_hours * 3600, stage=stage)
+
+
+def prefetch_document_stages(
+    file_paths: Iterable[str],
+    stages: Iterable[str] = ("layout", "ocr", "vision")
+) -> Dict[Tuple[str, str], Any]:
+    """Warm the cache for documents about to be processed.
+    
+    Args:
+        file_paths: Paths to documents
+        stages: Processing stages to prefetch
+        
+    Returns:
+        (file_path, stage) -> cached result (None if absent)
+    """
+    return get_cache_manager().prefetch(file_paths, stages)
 
 
 def get_cached_result(
@@ -4,14 +4,117 @@ This module handles loading, validation, and management of system configuration
 from YAML files and environment variables.
 """
 
+import functools
 import os
+import re
+from collections import ChainMap
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-import yaml
-from pydantic import BaseModel, Field, SecretStr, field_validator
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
 from loguru import logger
 
+@functools.cache
+def _yaml() -> Tuple[Any, Any, Any]:
+    """Import PyYAML on first use (keeps it off the import path of this module).
+    
+    Returns:
+        (yaml module, loader, dumper), preferring the libyaml-backed
+        CSafeLoader/CSafeDumper when PyYAML was built with it (~10x faster)
+    """
+    import yaml
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+# Parsed config files: path -> (st_mtime_ns, parsed YAML)
+_YAML_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+# Loaded configs: abspath -> (file/env fingerprint, validated SystemConfig)
+_PARSE_CACHE: Dict[str, Tuple[tuple, Any]] = {}
+
+# Config loaded with no config file and no SOVEREIGN_* variables (the same
+# for every path, e.g. in CI/tests); handed out as copies
+_DEFAULT_CONFIG: Optional[Any] = None
+
+# Env-only secrets, never written to saved config files
+_SECRET_FIELDS = ("ngrok_token", "access_token")
+
+# Allowed values for the enum-like string settings; tuples keep error
+# messages in a stable order, frozensets give O(1) membership checks
+_PROFILES = ("dev", "prod", "demo")
+_PROCESSING_MODES = ("local", "hybrid", "remote")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_ALLOWED_PROFILES = frozenset(_PROFILES)
+_ALLOWED_MODES = frozenset(_PROCESSING_MODES)
+_ALLOWED_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Environment variable prefix for configuration overrides
+_ENV_PREFIX = "SOVEREIGN_"
+
+# Re-run validators on every SystemConfig attribute write only when opted in
+# (SOVEREIGN_STRICT_CONFIG=1, e.g. in dev); otherwise writes are plain sets
+_STRICT_CONFIG = os.environ.get(f"{_ENV_PREFIX}STRICT_CONFIG") == "1"
+
+# peek_mode reads only this many bytes of the config file before falling back
+_PEEK_BYTES = 512
+_PEEK_MODE_RE = re.compile(rb"^processing_mode:[ \t]*[\"']?(\w+)", re.M)
+
+
+# Environment variable values read as True (anything else is False)
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
+def parse_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.lower() in _TRUE_VALUES
+
+
+# Parsed overrides for the last seen set of SOVEREIGN_* variables
+_ENV_CACHE: Dict[frozenset, Dict[str, Any]] = {}
+
+
+def _sovereign_env() -> frozenset:
+    """Snapshot of the SOVEREIGN_* environment variables as (name, value) pairs."""
+    return frozenset(
+        (k, v) for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)
+    )
+
+
+def _parse_list(value: str) -> List[str]:
+    """Interpret a comma-separated environment variable value as a list."""
+    return value.split(',')
+
+
+# Map of environment variable names to config keys (optionally with a converter),
+# built once at import and read-only
+_ENV_MAPPINGS: Mapping[str, Any] = MappingProxyType({
+    f"{_ENV_PREFIX}PROCESSING_MODE": "processing_mode",
+    f"{_ENV_PREFIX}CONFLICT_THRESHOLD": ("conflict_threshold", float),
+    f"{_ENV_PREFIX}BATCH_SIZE": ("batch_size", int),
+    f"{_ENV_PREFIX}MAX_MEMORY_USAGE": ("max_memory_usage", float),
+    f"{_ENV_PREFIX}CPU_CORES": ("cpu_cores", int),
+    f"{_ENV_PREFIX}AVAILABLE_RAM_GB": ("available_ram_gb", int),
+    f"{_ENV_PREFIX}HAS_GPU": ("has_gpu", parse_bool),
+    f"{_ENV_PREFIX}OCR_CONFIDENCE_THRESHOLD": ("ocr_confidence_threshold", float),
+    f"{_ENV_PREFIX}VISION_CONFIDENCE_THRESHOLD": ("vision_confidence_threshold", float),
+    f"{_ENV_PREFIX}NGROK_TOKEN": "ngrok_token",  # Sensitive: env only
+    f"{_ENV_PREFIX}NGROK_URL": "ngrok_url",
+    f"{_ENV_PREFIX}TUNNEL_TIMEOUT": ("tunnel_timeout", int),
+    f"{_ENV_PREFIX}VECTOR_COLLECTION": "vector_collection",
+    f"{_ENV_PREFIX}EMBEDDING_MODEL": "embedding_model",
+    f"{_ENV_PREFIX}QDRANT_HOST": "qdrant_host",
+    f"{_ENV_PREFIX}QDRANT_PORT": ("qdrant_port", int),
+    f"{_ENV_PREFIX}REQUIRED_OLLAMA_MODELS": ("required_ollama_models", _parse_list),
+    f"{_ENV_PREFIX}LOG_LEVEL": "log_level",
+    f"{_ENV_PREFIX}LOG_FILE_PATH": "log_file_path",
+    f"{_ENV_PREFIX}LOG_ROTATION": "log_rotation",
+})
+
 
 class SystemConfig(BaseModel):
     """System configuration model matching the design specification.
@@ -147,18 +250,16 @@ class SystemConfig(BaseModel):
     @classmethod
     def validate_profile(cls, v: str) -> str:
         """Validate profile is one of the allowed values."""
-        allowed = ["dev", "prod", "demo"]
-        if v not in allowed:
-            raise ValueError(f"profile must be one of {allowed}, got '{v}'")
+        if v not in _ALLOWED_PROFILES:
+            raise ValueError(f"profile must be one of {list(_PROFILES)}, got '{v}'")
         return v
     
     @field_validator('processing_mode')
     @classmethod
     def validate_processing_mode(cls, v: str) -> str:
         """Validate processing mode is one of the allowed values."""
-        allowed = ["local", "hybrid", "remote"]
-        if v not in allowed:
-            raise ValueError(f"processing_mode must be one of {allowed}, got '{v}'")
+        if v not in _ALLOWED_MODES:
+            raise ValueError(f"processing_mode must be one of {list(_PROCESSING_MODES)}, got '{v}'")
         return v
     
     @field_validator('conflict_threshold')
@@ -189,14 +290,23 @@ class SystemConfig(BaseModel):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is one of the allowed values."""
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v_upper = v.upper()
-        if v_upper not in allowed:
-            raise ValueError(f"log_level must be one of {allowed}, got '{v}'")
+        if v_upper not in _ALLOWED_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {list(_LOG_LEVELS)}, got '{v}'")
         return v_upper
     
-    class Config:
-        validate_assignment = True
+    model_config = ConfigDict(validate_assignment=_STRICT_CONFIG)
+
+
+@functools.lru_cache(maxsize=1)
+def _detector():
+    """Shared HardwareDetector for the startup checks (created on first use).
+    
+    Raises:
+        ImportError: If the hardware utilities are unavailable
+    """
+    from local_body.utils.hardware import HardwareDetector
+    return HardwareDetector()
 
 
 class ConfigManager:
@@ -224,19 +334,28 @@ class ConfigManager:
         Returns:
             Loaded and validated SystemConfig instance
         """
-        # Start with default values
-        config_dict: Dict[str, Any] = {}
-        
-        # Load from YAML file if it exists
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
-                if yaml_config:
-                    config_dict.update(yaml_config)
-        
-        # Override with environment variables
+        global _DEFAULT_CONFIG
+        
+        # Nothing changed since the last load of this file: reuse it
+        path = os.path.abspath(self.config_path)
+        fingerprint = self._fingerprint()
+        cached = _PARSE_CACHE.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            self._config = cached[1].model_copy(deep=True)
+            return self._config
+        
+        # No file and no env overrides: same result as any earlier such load
+        defaults_only = fingerprint[0] is None and not fingerprint[1]
+        if defaults_only and _DEFAULT_CONFIG is not None:
+            self._config = _DEFAULT_CONFIG.model_copy(deep=True)
+            return self._config
+        
+        # Environment variables override the YAML file (if it exists); missing
+        # keys fall back to the SystemConfig defaults. One merged copy, which
+        # also keeps the cached YAML/env dicts untouched.
+        yaml_config = self._read_yaml()
         env_overrides = self._load_from_env()
-        config_dict.update(env_overrides)
+        config_dict: Dict[str, Any] = dict(ChainMap(env_overrides, yaml_config or {}))
         
         # Apply profile-specific settings
         config_dict = self._apply_profile_settings(config_dict)
@@ -246,9 +365,7 @@ class ConfigManager:
         
         # Perform hardware health check on startup
         try:
-            from local_body.utils.hardware import HardwareDetector
-            
-            detector = HardwareDetector()
+            detector = _detector()
             hardware_ok = detector.check_system_health(required_ram_gb=8)
             
             # If hardware is insufficient and processing mode is not set,
@@ -268,8 +385,78 @@ class ConfigManager:
         # Perform hardware-aware safety checks
         self._validate_hardware_safety()
         
+        _PARSE_CACHE[path] = (fingerprint, self._config.model_copy(deep=True))
+        if defaults_only:
+            _DEFAULT_CONFIG = self._config.model_copy(deep=True)
         return self._config
     
+    def peek_mode(self) -> str:
+        """Return processing_mode without loading and validating the full config.
+        
+        Meant for mode dispatch: the SOVEREIGN_PROCESSING_MODE override wins,
+        then a regex over the first bytes of the config file; the whole file is
+        parsed only when the key is not found there.
+        
+        Returns:
+            Processing mode string (unvalidated), "hybrid" if not configured
+        """
+        if self._config is not None:
+            return self._config.processing_mode
+        
+        env_mode = os.environ.get(f"{_ENV_PREFIX}PROCESSING_MODE")
+        if env_mode:
+            return env_mode
+        
+        try:
+            with open(self.config_path, 'rb') as f:
+                buf = f.read(_PEEK_BYTES)
+        except OSError:
+            return SystemConfig.model_fields["processing_mode"].default
+        
+        match = _PEEK_MODE_RE.search(buf)
+        # A value running into the end of a full buffer may be truncated
+        if match and (match.end() < len(buf) or len(buf) < _PEEK_BYTES):
+            return match.group(1).decode('ascii')
+        
+        yaml_config = self._read_yaml()
+        if isinstance(yaml_config, dict) and yaml_config.get("processing_mode"):
+            return str(yaml_config["processing_mode"])
+        return SystemConfig.model_fields["processing_mode"].default
+    
+    def _fingerprint(self) -> tuple:
+        """Identify the inputs of load_config: config file mtime/size and SOVEREIGN_* env.
+        
+        Returns:
+            Hashable fingerprint that changes whenever the loaded config could
+        """
+        try:
+            st = os.stat(self.config_path)
+            file_key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_key = None
+        return (file_key, _sovereign_env())
+    
+    def _read_yaml(self) -> Any:
+        """Parse the config file, reusing the last parse while its mtime is unchanged.
+        
+        Returns:
+            Parsed YAML content, or None if the file does not exist
+        """
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        cached = _YAML_CACHE.get(self.config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with open(self.config_path, 'r') as f:
+            yaml, loader, _ = _yaml()
+            yaml_config = yaml.load(f, Loader=loader)
+        _YAML_CACHE[self.config_path] = (mtime_ns, yaml_config)
+        return yaml_config
+    
     def _load_from_env(self) -> Dict[str, Any]:
         """Load configuration overrides from environment variables.
         
@@ -281,49 +468,40 @@ class ConfigManager:
         Returns:
             Dictionary of configuration overrides from environment
         """
+        env_vars = _sovereign_env()
+        
+        # Common case: no overrides at all
+        if not env_vars:
+            return {"profile": "dev"}
+        
+        cached = _ENV_CACHE.get(env_vars)
+        if cached is not None:
+            return dict(cached)
+        
         env_config = {}
-        prefix = "SOVEREIGN_"
+        prefix = _ENV_PREFIX
+        env = dict(env_vars)
         
         # Load profile from environment (default: dev)
-        env_profile = os.getenv(f"{prefix}ENV", os.getenv(f"{prefix}PROFILE", "dev"))
+        env_profile = env.get(f"{prefix}ENV", env.get(f"{prefix}PROFILE", "dev"))
         env_config["profile"] = env_profile
         
-        # Map of environment variable names to config keys
-        env_mappings = {
-            f"{prefix}PROCESSING_MODE": "processing_mode",
-            f"{prefix}CONFLICT_THRESHOLD": ("conflict_threshold", float),
-            f"{prefix}BATCH_SIZE": ("batch_size", int),
-            f"{prefix}MAX_MEMORY_USAGE": ("max_memory_usage", float),
-            f"{prefix}CPU_CORES": ("cpu_cores", int),
-            f"{prefix}AVAILABLE_RAM_GB": ("available_ram_gb", int),
-            f"{prefix}HAS_GPU": ("has_gpu", lambda x: x.lower() in ['true', '1', 'yes']),
-            f"{prefix}OCR_CONFIDENCE_THRESHOLD": ("ocr_confidence_threshold", float),
-            f"{prefix}VISION_CONFIDENCE_THRESHOLD": ("vision_confidence_threshold", float),
-            f"{prefix}NGROK_TOKEN": "ngrok_token",  # Sensitive: env only
-            f"{prefix}NGROK_URL": "ngrok_url",
-            f"{prefix}TUNNEL_TIMEOUT": ("tunnel_timeout", int),
-            f"{prefix}VECTOR_COLLECTION": "vector_collection",
-            f"{prefix}EMBEDDING_MODEL": "embedding_model",
-            f"{prefix}QDRANT_HOST": "qdrant_host",
-            f"{prefix}QDRANT_PORT": ("qdrant_port", int),
-            f"{prefix}REQUIRED_OLLAMA_MODELS": ("required_ollama_models", lambda x: x.split(',')),
-            f"{prefix}LOG_LEVEL": "log_level",
-            f"{prefix}LOG_FILE_PATH": "log_file_path",
-            f"{prefix}LOG_ROTATION": "log_rotation",
-        }
-        
-        for env_var, mapping in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                if isinstance(mapping, tuple):
-                    config_key, converter = mapping
-                    try:
-                        env_config[config_key] = converter(value)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Failed to convert {env_var}={value}: {e}")
-                else:
-                    env_config[mapping] = value
-        
+        for env_var, value in env_vars:
+            mapping = _ENV_MAPPINGS.get(env_var)
+            if mapping is None:
+                continue
+            if isinstance(mapping, tuple):
+                config_key, converter = mapping
+                try:
+                    env_config[config_key] = converter(value)
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Failed to convert {env_var}={value}: {e}")
+            else:
+                env_config[mapping] = value
+        
+        # Only the latest environment is worth remembering
+        _ENV_CACHE.clear()
+        _ENV_CACHE[env_vars] = dict(env_config)
         return env_config
     
     def _apply_profile_settings(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -373,9 +551,7 @@ class ConfigManager:
             return
         
         try:
-            from local_body.utils.hardware import HardwareDetector
-            
-            detector = HardwareDetector()
+            detector = _detector()
             total_ram = detector.get_total_ram_gb()
             available_ram = detector.get_available_ram_gb()
             
@@ -392,7 +568,7 @@ class ConfigManager:
                 )
             
             # Validate minimum RAM requirement
-            if not detector.validate_resource_availability(4.0):
+            if total_ram < 4.0:  # same check as validate_resource_availability(4.0)
                 logger.error(
                     f"System has insufficient RAM ({total_ram:.1f}GB). "
                     f"Minimum 4GB required. System may be unstable."
@@ -426,13 +602,15 @@ class ConfigManager:
             raise RuntimeError("No configuration to save. Load or create config first.")
         
         save_path = path or self.config_path
-        config_dict = self._config.model_dump(exclude_none=True)
+        # Secrets are env-only and SafeDumper can't represent SecretStr
+        config_dict = self._config.model_dump(exclude_none=True, exclude=set(_SECRET_FIELDS))
         
         # Ensure directory exists
         Path(save_path).parent.mkdir(parents=True, exist_ok=True)
         
         with open(save_path, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml, _, dumper = _yaml()
+            yaml.dump(config_dict, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
     
     def update_config(self, updates: Dict[str, Any]) -> SystemConfig:
         """Update configuration with new values.
@@ -446,8 +624,7 @@ class ConfigManager:
         if self._config is None:
             self._config = SystemConfig(**updates)
         else:
-            current_dict = self._config.model_dump()
-            current_dict.update(updates)
-            self._config = SystemConfig(**current_dict)
+            # Validate straight from the current field values; no model_dump() round-trip
+            self._config = SystemConfig.model_validate({**self._config.__dict__, **updates})
         
         return self._config
@@ -1,37 +1,141 @@
 """Core data models for Sovereign-Doc document processing system.
 
-This module defines the Pydantic models for representing documents, pages, regions,
-conflicts, and related data structures used throughout the system.
+This module defines the data structures for representing documents, pages, regions,
+conflicts, and related data used throughout the system. Per-region objects (boxes,
+content, regions, pages) are slotted dataclasses, created hundreds of times per
+document; Pydantic models are kept at the boundaries (Document, Conflict) and still
+validate nested dataclasses when loading from dicts or JSON.
 """
 
+import base64
+import calendar
+import functools
 import gzip
-import json
+import io
 import os
+import re
+import secrets
+import sys
 import tempfile
-from datetime import datetime
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from uuid import uuid4
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+import numpy as np
+from pydantic import (
+    AfterValidator, BaseModel, BeforeValidator, Discriminator, Field, PlainSerializer, Tag,
+    TypeAdapter, ValidationError, field_validator
+)
 
+# Optional: SIMD base64 for page images (falls back to the stdlib codec)
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
 
-class BoundingBox(BaseModel):
-    """Represents a rectangular bounding box in a document."""
+
+# gzip level for Document.save_to_json(compress=True)
+_GZIP_LEVEL = 3
+
+
+def _new_id() -> str:
+    """Random 128-bit identifier as 32 hex chars (os.urandom, no UUID formatting)."""
+    return secrets.token_hex(16)
+
+
+def _new_ids(n: int) -> List[str]:
+    """n identifiers like _new_id() from a single os.urandom draw."""
+    pool = os.urandom(16 * n).hex()
+    return [pool[i:i + 32] for i in range(0, 32 * n, 32)]
+
+
+def _check_unit_interval(name: str, value: float) -> None:
+    """Raise ValueError unless 0 <= value <= 1."""
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{name} must be between 0.0 and 1.0, got {value}")
+
+
+def _unchecked(cls, data: Dict[str, Any]):
+    """Build a dataclass instance from trusted data without running __post_init__."""
+    obj = object.__new__(cls)
+    for f in fields(cls):
+        if f.name in data:
+            value = data[f.name]
+        elif f.default_factory is not MISSING:
+            value = f.default_factory()
+        else:
+            value = f.default
+        object.__setattr__(obj, f.name, value)
+    return obj
+
+
+def _decode_base64(value: Union[str, bytes, None]) -> Optional[bytes]:
+    """Deserialize base64 strings back to bytes when loading from JSON."""
+    if isinstance(value, str):
+        if PYBASE64_AVAILABLE:
+            return pybase64.b64decode(value, validate=False)
+        return base64.b64decode(value)
+    return value
+
+
+def _encode_base64(value: bytes) -> str:
+    """Serialize bytes as base64 strings for JSON compatibility."""
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(value)
+    return base64.b64encode(value).decode('ascii')
+
+
+def _utc_now() -> datetime:
+    """Current time as an aware UTC datetime (replaces deprecated datetime.utcnow)."""
+    return datetime.now(timezone.utc)
+
+
+def _assume_utc(value: datetime) -> datetime:
+    """Read naive datetimes as UTC, as written by the old datetime.utcnow default."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _epoch_ns(value: datetime) -> int:
+    """Exact integer epoch nanoseconds of an aware datetime (no float rounding)."""
+    return calendar.timegm(value.utctimetuple()) * 1_000_000_000 + value.microsecond * 1000
+
+
+# Timestamps: aware UTC datetimes; naive input (legacy JSON) is taken as UTC
+UtcDatetime = Annotated[datetime, AfterValidator(_assume_utc)]
+
+
+# Image payload: base64 in JSON, raw bytes in Python
+ImageBytes = Annotated[
+    bytes,
+    BeforeValidator(_decode_base64),
+    PlainSerializer(_encode_base64, when_used='json'),
+]
+
+
+@dataclass(slots=True)
+class BoundingBox:
+    """Represents a rectangular bounding box in a document.
     
-    x: float = Field(..., description="X coordinate of top-left corner")
-    y: float = Field(..., description="Y coordinate of top-left corner")
-    width: float = Field(..., ge=0, description="Width of the bounding box")
-    height: float = Field(..., ge=0, description="Height of the bounding box")
+    x, y are the top-left corner; all values must be non-negative.
+    """
     
-    @field_validator('x', 'y')
-    @classmethod
-    def validate_coordinates(cls, v: float) -> float:
-        """Ensure coordinates are non-negative."""
-        if v < 0:
+    x: float
+    y: float
+    width: float
+    height: float
+    
+    def __post_init__(self) -> None:
+        if self.x < 0 or self.y < 0:
             raise ValueError("Coordinates must be non-negative")
-        return v
+        if self.width < 0 or self.height < 0:
+            raise ValueError("Width and height must be non-negative")
 
 
 class RegionType(str, Enum):
@@ -43,83 +147,359 @@ class RegionType(str, Enum):
     CHART = "chart"
 
 
-class TextContent(BaseModel):
+# RegionType -> uint8 code used in Page.to_arrays()
+REGION_TYPE_CODES: Dict[RegionType, int] = {t: i for i, t in enumerate(RegionType)}
+
+
+@dataclass(slots=True)
+class TextContent:
     """Represents extracted text content from a region."""
     
-    text: str = Field(..., description="Extracted text content")
-    language: Optional[str] = Field(default="en", description="Detected language code")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="OCR confidence score")
+    text: str
+    confidence: float  # OCR confidence score
+    language: Optional[str] = "en"  # Detected language code
+    
+    def __post_init__(self) -> None:
+        _check_unit_interval("confidence", self.confidence)
+        if self.language is not None:
+            self.language = sys.intern(self.language)
 
 
-class TableContent(BaseModel):
+@dataclass(slots=True)
+class TableContent:
     """Represents extracted table content with structure preservation."""
     
-    rows: List[List[str]] = Field(..., description="Table data as 2D array")
-    headers: Optional[List[str]] = Field(default=None, description="Table column headers")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Table detection confidence")
+    rows: List[List[str]]  # Table data as 2D array
+    confidence: float  # Table detection confidence
+    headers: Optional[List[str]] = None
+    
+    def __post_init__(self) -> None:
+        _check_unit_interval("confidence", self.confidence)
 
 
-class ImageContent(BaseModel):
+@dataclass(slots=True)
+class ImageContent:
     """Represents image or chart content with vision analysis."""
     
-    description: str = Field(..., description="Vision model description of the image")
-    extracted_values: Optional[Dict[str, Any]] = Field(
-        default=None, 
-        description="Numeric values extracted from charts/diagrams"
-    )
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Vision analysis confidence")
+    description: str  # Vision model description of the image
+    confidence: float  # Vision analysis confidence
+    extracted_values: Optional[Dict[str, Any]] = None  # Values read from charts/diagrams
+    
+    def __post_init__(self) -> None:
+        _check_unit_interval("confidence", self.confidence)
 
 
-class Region(BaseModel):
+_CONTENT_CLASSES = {'text': TextContent, 'table': TableContent, 'image': ImageContent}
+_CONTENT_TAGS = {cls: tag for tag, cls in _CONTENT_CLASSES.items()}
+
+
+def _content_tag(value: Any) -> Optional[str]:
+    """Content variant of a content object or dict (by its distinguishing key)."""
+    if isinstance(value, dict):
+        if 'text' in value:
+            return 'text'
+        if 'rows' in value:
+            return 'table'
+        return 'image'
+    return _CONTENT_TAGS.get(type(value))
+
+
+# Region content: validated by dispatching on _content_tag instead of trying
+# each variant in turn; works on existing JSON, which carries no tag field
+RegionContent = Annotated[
+    Union[
+        Annotated[TextContent, Tag('text')],
+        Annotated[TableContent, Tag('table')],
+        Annotated[ImageContent, Tag('image')],
+    ],
+    Discriminator(_content_tag),
+]
+
+
+def _content_from_dict(data: Dict[str, Any]) -> Union[TextContent, TableContent, ImageContent]:
+    """Pick the content class from the keys of a trusted content dict."""
+    return _unchecked(_CONTENT_CLASSES[_content_tag(data)], data)
+
+
+@dataclass(slots=True)
+class Region:
     """Represents a detected region within a document page."""
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique region identifier")
-    bbox: BoundingBox = Field(..., description="Bounding box coordinates")
-    region_type: RegionType = Field(..., description="Type of region content")
-    content: Union[TextContent, TableContent, ImageContent] = Field(
-        ..., 
-        description="Extracted content based on region type"
-    )
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Overall region confidence")
-    extraction_method: str = Field(
-        ..., 
-        description="Method used for extraction (ocr, vision, hybrid)"
-    )
+    bbox: BoundingBox
+    region_type: RegionType
+    content: RegionContent  # Based on region type
+    confidence: float  # Overall region confidence
+    extraction_method: str  # Method used for extraction (ocr, vision, hybrid)
+    id: str = field(default_factory=_new_id)
+    
+    def __post_init__(self) -> None:
+        # Nested dicts (e.g. Region(**json_dict)) are validated into their classes
+        if not isinstance(self.bbox, BoundingBox):
+            if not isinstance(self.bbox, dict):
+                raise TypeError(f"bbox must be a BoundingBox or dict, got {type(self.bbox).__name__}")
+            self.bbox = BoundingBox(**self.bbox)
+        if type(self.content) not in _CONTENT_TAGS:
+            if not isinstance(self.content, dict):
+                raise TypeError(
+                    f"content must be a content object or dict, got {type(self.content).__name__}"
+                )
+            self.content = _content_adapter().validate_python(self.content)
+        # RegionType(...) returns the shared member, so region_type needs no interning
+        if not isinstance(self.region_type, RegionType):
+            self.region_type = RegionType(self.region_type)
+        _check_unit_interval("confidence", self.confidence)
+        # A handful of method names repeat across every region of a document
+        self.extraction_method = sys.intern(self.extraction_method)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Region':
+        """Validate a plain dict (e.g. loaded from JSON) into a Region.
+        
+        Raises:
+            ValueError: If the data doesn't match the schema
+        """
+        return _region_adapter().validate_python(data)
+    
+    @classmethod
+    def from_dict_unchecked(cls, data: Dict[str, Any]) -> 'Region':
+        """Build a Region from trusted upstream data, skipping all validation.
+        
+        Only for bulk ingestion of output produced by our own pipeline.
+        """
+        values = dict(data)
+        bbox = values['bbox']
+        if isinstance(bbox, dict):
+            values['bbox'] = _unchecked(BoundingBox, bbox)
+        content = values['content']
+        if isinstance(content, dict):
+            values['content'] = _content_from_dict(content)
+        values['region_type'] = RegionType(values['region_type'])
+        values['extraction_method'] = sys.intern(values['extraction_method'])
+        return _unchecked(cls, values)
+    
+    def to_dict(self, mode: str = 'python') -> Dict[str, Any]:
+        """Serialize to a dict ('json' mode gives JSON-compatible values)."""
+        return _region_adapter().dump_python(self, mode=mode)
+    
+    @staticmethod
+    def new_ids(n: int) -> List[str]:
+        """Pre-draw ids for n regions about to be built (one urandom call)."""
+        return _new_ids(n)
+    
+    @classmethod
+    def build_many(cls, raw: List[Dict[str, Any]], strict: bool = False) -> List['Region']:
+        """Validate a list of region dicts in one adapter call.
+        
+        Args:
+            raw: Region dicts, e.g. from an OCR/layout result or a checkpoint
+            strict: Disable type coercion (inputs must already have the exact types)
+        
+        Raises:
+            ValueError: If any item doesn't match the schema
+        """
+        return _list_adapter(cls).validate_python(raw, strict=strict)
+
+
+@functools.cache
+def _content_adapter() -> TypeAdapter:
+    """Pydantic adapter for validating a region content dict."""
+    return TypeAdapter(RegionContent)
+
 
+@functools.cache
+def _region_adapter() -> TypeAdapter:
+    """Pydantic adapter for validating/serializing Regions outside a Document."""
+    return TypeAdapter(Region)
 
-class Page(BaseModel):
+
+@functools.cache
+def _list_adapter(cls: type) -> TypeAdapter:
+    """Pydantic adapter for List[cls], built once per model class."""
+    return TypeAdapter(List[cls])
+
+
+@dataclass(slots=True, frozen=True)
+class ImageRef:
+    """Location of an encoded image inside a file (e.g. a per-document page store).
+    
+    Lets a Page point at its image instead of holding multi-MB bytes, so
+    pages stay small in memory and in model_dump().
+    """
+    
+    path: str
+    offset: int
+    length: int
+    
+    @classmethod
+    def append(cls, path: Union[str, Path], data: bytes) -> 'ImageRef':
+        """Append data to the file at path and return a reference to it."""
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            f.write(data)
+        return cls(path=str(path), offset=offset, length=len(data))
+    
+    def read(self) -> bytes:
+        """Read the referenced image bytes from the file."""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(self.length)
+        if len(data) != self.length:
+            raise OSError(f"Truncated image in '{self.path}' at offset {self.offset}")
+        return data
+
+
+# Decoded PIL images shared by the agents that read a page, most recent last:
+# id(page) -> (raw image object it was decoded from, image). Entries live for
+# one document run (every stage walks every page, so any smaller per-page
+# window re-decodes long documents) and are dropped by
+# Document.release_decoded_images(); never part of the Page or its copies.
+# The cap is only a safety net for documents that are never released, as a
+# 300-DPI page bitmap is ~25 MB.
+_DECODED_PAGES_MAX = 64
+_decoded_pages: "OrderedDict[int, Tuple[Any, Any]]" = OrderedDict()
+_decoded_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class Page:
     """Represents a single page in a document."""
     
-    page_number: int = Field(..., ge=1, description="Page number (1-indexed)")
-    regions: List[Region] = Field(default_factory=list, description="Detected regions on this page")
-    raw_image_bytes: Optional[bytes] = Field(default=None, description="Original page image as bytes")
-    processed_image_bytes: Optional[bytes] = Field(
-        default=None, 
-        description="Optional preprocessed image (denoised, binarized)"
-    )
-    metadata: Optional[Dict[str, Any]] = Field(
-        default=None, 
-        description="Additional page-level metadata"
-    )
+    page_number: int  # 1-indexed
+    regions: List[Region] = field(default_factory=list)
+    raw_image_bytes: Optional[ImageBytes] = None  # Original page image
+    processed_image_bytes: Optional[ImageBytes] = None  # Preprocessed (denoised, binarized)
+    metadata: Optional[Dict[str, Any]] = None  # Additional page-level metadata
+    raw_image_ref: Optional[ImageRef] = None  # Original page image stored out of line
     
-    @field_serializer('raw_image_bytes', 'processed_image_bytes', when_used='json')
-    def serialize_bytes_as_base64(self, value: Optional[bytes]) -> Optional[str]:
-        """Serialize bytes fields as base64 strings for JSON compatibility."""
-        if value is None:
-            return None
-        import base64
-        return base64.b64encode(value).decode('ascii')
+    def __post_init__(self) -> None:
+        if self.page_number < 1:
+            raise ValueError(f"page_number must be >= 1, got {self.page_number}")
+        if isinstance(self.raw_image_bytes, str):
+            self.raw_image_bytes = _decode_base64(self.raw_image_bytes)
+        if isinstance(self.processed_image_bytes, str):
+            self.processed_image_bytes = _decode_base64(self.processed_image_bytes)
     
-    @field_validator('raw_image_bytes', 'processed_image_bytes', mode='before')
     @classmethod
-    def deserialize_base64_to_bytes(cls, value: Union[str, bytes, None]) -> Optional[bytes]:
-        """Deserialize base64 strings back to bytes when loading from JSON."""
-        if value is None or isinstance(value, bytes):
-            return value
-        if isinstance(value, str):
-            import base64
-            return base64.b64decode(value)
-        return value
+    def build_many(cls, raw: List[Dict[str, Any]], strict: bool = False) -> List['Page']:
+        """Validate a list of page dicts in one adapter call (see Region.build_many)."""
+        return _list_adapter(cls).validate_python(raw, strict=strict)
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Structure-of-arrays view of the regions for vectorized analytics.
+        
+        Returns:
+            Dict with 'bbox_xywh' (N, 4) float32, 'confidences' (N,) float32
+            and 'region_types' (N,) uint8 (codes from REGION_TYPE_CODES), in
+            the same order as self.regions
+        """
+        n = len(self.regions)
+        confidences = np.empty(n, dtype=np.float32)
+        region_types = np.empty(n, dtype=np.uint8)
+        
+        for i, region in enumerate(self.regions):
+            confidences[i] = region.confidence
+            region_types[i] = REGION_TYPE_CODES[region.region_type]
+        
+        return {
+            'bbox_xywh': self.bbox_array,
+            'confidences': confidences,
+            'region_types': region_types,
+        }
+    
+    @property
+    def bbox_array(self) -> np.ndarray:
+        """Region boxes as an (N, 4) float32 array of x, y, width, height.
+        
+        Built on each access: regions and their boxes are mutable, so a
+        cached copy could go stale.
+        """
+        boxes = [region.bbox for region in self.regions]
+        return np.fromiter(
+            (v for b in boxes for v in (b.x, b.y, b.width, b.height)),
+            dtype=np.float32,
+            count=4 * len(boxes),
+        ).reshape(-1, 4)
+    
+    @property
+    def has_raw_image(self) -> bool:
+        """True if the page has an original image, inline or by reference."""
+        return bool(self.raw_image_bytes) or self.raw_image_ref is not None
+    
+    def read_raw_image(self) -> Optional[bytes]:
+        """Return the original page image (inline bytes, or read through the ref).
+        
+        Returns:
+            Encoded image data, or None if the page has no image
+        """
+        if self.raw_image_bytes is not None:
+            return self.raw_image_bytes
+        if self.raw_image_ref is not None:
+            return self.raw_image_ref.read()
+        return None
+    
+    def spill_raw_image(self, path: Union[str, Path]) -> None:
+        """Move raw_image_bytes out to the file at path, keeping an ImageRef.
+        
+        Args:
+            path: Page store file; the image is appended to it
+        """
+        if self.raw_image_bytes is None:
+            return
+        self.raw_image_ref = ImageRef.append(path, self.raw_image_bytes)
+        self.raw_image_bytes = None
+        # Spilling is meant to free memory: drop the decoded bitmap as well
+        self.release_decoded_image()
+    
+    def _raw_source(self) -> Optional[Any]:
+        """The object the page image currently comes from (bytes or ImageRef)."""
+        if self.raw_image_bytes is not None:
+            return self.raw_image_bytes
+        return self.raw_image_ref
+    
+    @property
+    def decoded_image(self) -> Optional[Any]:
+        """Already-decoded PIL image for the raw image, or None (never decodes)."""
+        with _decoded_lock:
+            entry = _decoded_pages.get(id(self))
+            # The stored source keeps a recycled id() from matching another page
+            if entry is None or entry[0] is not self._raw_source():
+                return None
+            _decoded_pages.move_to_end(id(self))
+            return entry[1]
+    
+    def set_decoded_image(self, image: Any) -> None:
+        """Remember a PIL image that corresponds to the current raw image.
+        
+        The image is kept until release_decoded_image() (or, past
+        _DECODED_PAGES_MAX pages in flight, least recently used first).
+        Consumers must treat the image as read-only.
+        """
+        with _decoded_lock:
+            _decoded_pages[id(self)] = (self._raw_source(), image)
+            _decoded_pages.move_to_end(id(self))
+            while len(_decoded_pages) > _DECODED_PAGES_MAX:
+                _decoded_pages.popitem(last=False)
+    
+    def release_decoded_image(self) -> None:
+        """Drop the shared decoded image for this page, if any."""
+        with _decoded_lock:
+            _decoded_pages.pop(id(self), None)
+    
+    def get_decoded_image(self) -> Optional[Any]:
+        """Return the PIL image for the raw image, decoding it at most once.
+        
+        Returns:
+            Shared read-only PIL image, or None if the page has no image
+        """
+        if self._raw_source() is None:
+            return None
+        image = self.decoded_image
+        if image is None:
+            from PIL import Image
+            image = Image.open(io.BytesIO(self.read_raw_image()))
+            image.load()
+            self.set_decoded_image(image)
+        return image
 
 
 class DocumentMetadata(BaseModel):
@@ -149,7 +529,7 @@ class ProcessingStatus(str, Enum):
 class Document(BaseModel):
     """Represents a complete document with all pages and metadata."""
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique document identifier")
+    id: str = Field(default_factory=_new_id, description="Unique document identifier")
     file_path: str = Field(..., description="Path to source document file")
     pages: List[Page] = Field(default_factory=list, description="Document pages")
     metadata: DocumentMetadata = Field(..., description="Document metadata")
@@ -157,11 +537,21 @@ class Document(BaseModel):
         default=ProcessingStatus.PENDING, 
         description="Current processing status"
     )
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, 
+    created_at: UtcDatetime = Field(
+        default_factory=_utc_now, 
         description="Timestamp when document was added"
     )
     
+    @property
+    def created_at_ns(self) -> int:
+        """Creation time as integer epoch nanoseconds."""
+        return _epoch_ns(self.created_at)
+    
+    def release_decoded_images(self) -> None:
+        """Drop the decoded page images shared by the agents during a run."""
+        for page in self.pages:
+            page.release_decoded_image()
+    
     @field_validator('file_path')
     @classmethod
     def validate_file_path(cls, v: str) -> str:
@@ -189,8 +579,8 @@ class Document(BaseModel):
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Serialize to JSON with proper formatting
-            json_str = self.model_dump_json(indent=2)
+            # Serialize to JSON bytes with proper formatting (no str -> UTF-8 copy)
+            json_bytes = self.__pydantic_serializer__.to_json(self, indent=2)
             
             # Atomic write: write to temp file first, then replace
             # This prevents corruption if process crashes during write
@@ -202,14 +592,15 @@ class Document(BaseModel):
             
             try:
                 if compress:
-                    # Write compressed
-                    with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
-                        f.write(json_str)
+                    # Write compressed; level 3 is much cheaper than the default 9
+                    # and page images (already encoded) gain little from more
+                    with gzip.open(temp_path, 'wb', compresslevel=_GZIP_LEVEL) as f:
+                        f.write(json_bytes)
                 else:
                     # Write uncompressed
-                    with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                        f.write(json_str)
+                    with os.fdopen(temp_fd, 'wb') as f:
                         temp_fd = None  # Prevent double close
+                        f.write(json_bytes)
                 
                 # Atomic replace: this is atomic on POSIX and Windows
                 os.replace(temp_path, str(file_path))
@@ -257,23 +648,24 @@ class Document(BaseModel):
             raise FileNotFoundError(f"Document file not found: '{path}'")
         
         try:
-            # Auto-detect gzip compression by file extension
+            # Auto-detect gzip compression by file extension; keep raw bytes
             if str(file_path).endswith('.gz'):
                 # Read gzip-compressed file
-                with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                    json_str = f.read()
+                with gzip.open(file_path, 'rb') as f:
+                    raw = f.read()
             else:
                 # Read uncompressed file
-                json_str = file_path.read_text(encoding='utf-8')
+                raw = file_path.read_bytes()
             
-            # Parse and validate against Pydantic schema
-            data = json.loads(json_str)
-            return cls(**data)
+            # Parse and validate in one pass in pydantic-core (no intermediate dict)
+            return cls.model_validate_json(raw)
             
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Invalid JSON in file '{path}': {e}"
-            ) from e
+        except ValidationError as e:
+            if any(err['type'] == 'json_invalid' for err in e.errors()):
+                raise ValueError(
+                    f"Invalid JSON in file '{path}': {e}"
+                ) from e
+            raise
         except OSError as e:
             raise OSError(
                 f"Failed to read document from '{path}': {e}"
@@ -306,16 +698,23 @@ class Document(BaseModel):
         # Check 2: Verify all page numbers are unique
         page_numbers = [page.page_number for page in self.pages]
         if len(page_numbers) != len(set(page_numbers)):
-            duplicates = [num for num in page_numbers if page_numbers.count(num) > 1]
+            duplicates = {num for num, count in Counter(page_numbers).items() if count > 1}
             raise ValueError(
-                f"Duplicate page numbers detected: {set(duplicates)}. "
+                f"Duplicate page numbers detected: {duplicates}. "
                 f"Each page must have a unique page_number."
             )
         
         # Check 3: Verify all regions have valid bounding boxes
         for page_idx, page in enumerate(self.pages, 1):
-            for region_idx, region in enumerate(page.regions, 1):
-                bbox = region.bbox
+            if not page.regions:
+                continue
+            
+            # One vectorized test per page; only flagged regions are re-checked
+            # exactly (float32 can round a tiny positive size down to 0)
+            sizes = page.bbox_array[:, 2:]
+            for idx in np.flatnonzero((sizes <= 0).any(axis=1)):
+                region_idx = int(idx) + 1
+                bbox = page.regions[idx].bbox
                 
                 if bbox.width <= 0:
                     raise ValueError(
@@ -332,6 +731,28 @@ class Document(BaseModel):
         return True
 
 
+def _impact_score(base_impact: float, discrepancy: float, text_conf: float, vision_conf: float) -> float:
+    """Conflict impact formula shared by update_impact_score and calculate_impact.
+    
+    base * min(discrepancy, 1), boosted 1.5x when both confidences are > 0.7
+    (a genuine disagreement), capped at 1.0.
+    """
+    impact = base_impact * (discrepancy if discrepancy < 1.0 else 1.0)
+    if text_conf > 0.7 and vision_conf > 0.7:
+        impact *= 1.5
+    return impact if impact < 1.0 else 1.0
+
+
+# Conflict.normalize_value: currency symbols to strip, magnitude suffixes
+_CURRENCY_RE = re.compile(r'[$€£¥]')
+_MULTIPLIERS = {
+    'K': 1_000,
+    'M': 1_000_000,
+    'B': 1_000_000_000,
+    'T': 1_000_000_000_000
+}
+
+
 class ConflictType(str, Enum):
     """Types of conflicts that can be detected."""
     
@@ -359,7 +780,7 @@ class ResolutionMethod(str, Enum):
 class Conflict(BaseModel):
     """Represents a detected conflict between extraction methods."""
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique conflict identifier")
+    id: str = Field(default_factory=_new_id, description="Unique conflict identifier")
     region_id: str = Field(..., description="ID of the region with conflict")
     conflict_type: ConflictType = Field(..., description="Type of conflict detected")
     text_value: Any = Field(..., description="Value extracted via OCR/text method")
@@ -388,11 +809,21 @@ class Conflict(BaseModel):
         le=1.0, 
         description="Calculated impact score for prioritization"
     )
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, 
+    created_at: UtcDatetime = Field(
+        default_factory=_utc_now, 
         description="Timestamp when conflict was detected"
     )
     
+    @property
+    def created_at_ns(self) -> int:
+        """Creation time as integer epoch nanoseconds."""
+        return _epoch_ns(self.created_at)
+    
+    @classmethod
+    def build_many(cls, raw: List[Dict[str, Any]], strict: bool = False) -> List['Conflict']:
+        """Validate a list of conflict dicts in one adapter call (see Region.build_many)."""
+        return _list_adapter(cls).validate_python(raw, strict=strict)
+    
     @staticmethod
     def normalize_value(value: Any) -> float:
         """Normalize various value formats to standard float.
@@ -412,8 +843,6 @@ class Conflict(BaseModel):
         Raises:
             ValueError: If value cannot be converted to a number
         """
-        import re
-        
         # Handle None
         if value is None:
             return 0.0
@@ -429,7 +858,7 @@ class Conflict(BaseModel):
             return 0.0
         
         # Remove currency symbols and whitespace
-        value_str = re.sub(r'[$€£¥]', '', value_str)
+        value_str = _CURRENCY_RE.sub('', value_str)
         value_str = value_str.strip()
         
         # Handle percentages
@@ -440,23 +869,16 @@ class Conflict(BaseModel):
             except ValueError:
                 raise ValueError(f"Cannot convert percentage '{value}' to float")
         
-        # Handle multipliers (M, B, K)
-        multipliers = {
-            'K': 1_000,
-            'M': 1_000_000,
-            'B': 1_000_000_000,
-            'T': 1_000_000_000_000
-        }
-        
-        for suffix, multiplier in multipliers.items():
-            if value_str.upper().endswith(suffix):
-                value_str = value_str[:-1].strip()
-                try:
-                    # Remove commas before conversion
-                    value_str = value_str.replace(',', '')
-                    return float(value_str) * multiplier
-                except ValueError:
-                    raise ValueError(f"Cannot convert '{value}' to float")
+        # Handle multipliers (K, M, B, T)
+        multiplier = _MULTIPLIERS.get(value_str[-1:].upper())
+        if multiplier is not None:
+            value_str = value_str[:-1].strip()
+            try:
+                # Remove commas before conversion
+                value_str = value_str.replace(',', '')
+                return float(value_str) * multiplier
+            except ValueError:
+                raise ValueError(f"Cannot convert '{value}' to float")
         
         # Handle comma-separated numbers
         value_str = value_str.replace(',', '')
@@ -482,21 +904,15 @@ class Conflict(BaseModel):
             Calculated impact score (0.0 to 1.5)
         """
         # Higher priority for financial figures (tables)
-        impact = 1.0 if region_type == "table" else 0.5
-        
-        # Scale by discrepancy magnitude (capped at 1.0)
-        impact *= min(self.discrepancy_percentage, 1.0)
-        
-        # Boost if both confidences are high (genuine disagreement)
-        text_conf = self.confidence_scores.get("text", 0.0)
-        vision_conf = self.confidence_scores.get("vision", 0.0)
-        
-        if text_conf > 0.7 and vision_conf > 0.7:
-            impact *= 1.5
-        
-        # Update the stored impact score
-        self.impact_score = min(impact, 1.0)  # Cap at 1.0 for consistency
-        
+        base_impact = 1.0 if region_type == "table" else 0.5
+        
+        scores = self.confidence_scores
+        self.impact_score = _impact_score(
+            base_impact,
+            self.discrepancy_percentage,
+            scores.get("text", 0.0),
+            scores.get("vision", 0.0)
+        )
         return self.impact_score
     
     def calculate_impact(self) -> float:
@@ -513,22 +929,14 @@ class Conflict(BaseModel):
         Returns:
             Calculated impact score (0.0 to 1.5)
         """
-        # Base impact (moderate priority)
-        base_impact = 0.75
-        
-        # Scale by discrepancy
-        impact = base_impact * min(self.discrepancy_percentage, 1.0)
-        
-        # Apply confidence boost
-        text_conf = self.confidence_scores.get("text", 0.0)
-        vision_conf = self.confidence_scores.get("vision", 0.0)
-        
-        if text_conf > 0.7 and vision_conf > 0.7:
-            impact *= 1.5
-        
-        # Update stored impact score
-        self.impact_score = min(impact, 1.0)  # Cap at 1.0
-        
+        # Base impact 0.75 (moderate priority)
+        scores = self.confidence_scores
+        self.impact_score = _impact_score(
+            0.75,
+            self.discrepancy_percentage,
+            scores.get("text", 0.0),
+            scores.get("vision", 0.0)
+        )
         return self.impact_score
     
     def resolve(self, resolution: 'ConflictResolution') -> None:
@@ -569,8 +977,8 @@ class ConflictResolution(BaseModel):
     chosen_value: Any = Field(..., description="Final value chosen after resolution")
     resolution_method: ResolutionMethod = Field(..., description="Method used for resolution")
     user_id: Optional[str] = Field(default=None, description="User who resolved the conflict")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, 
+    timestamp: UtcDatetime = Field(
+        default_factory=_utc_now, 
         description="Timestamp of resolution"
     )
     confidence: float = Field(
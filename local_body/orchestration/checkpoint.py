@@ -16,6 +16,13 @@ from loguru import logger
 from local_body.core.datamodels import Document, Region, Conflict, ConflictResolution
 from local_body.orchestration.state import DocumentProcessingState
 
+# Optional: faster parsing of large checkpoints (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class CheckpointManager:
     """Manages checkpoint persistence for document processing workflows.
@@ -77,9 +84,9 @@ class CheckpointManager:
                 logger.warning(f"No checkpoint found for {doc_id}")
                 return None
             
-            # Read JSON file
-            with open(checkpoint_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read JSON file as bytes (orjson parses them without a decode step)
+            raw = checkpoint_path.read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             # Reconstruct Pydantic objects
             state = self._deserialize_state(data)
@@ -147,7 +154,7 @@ class CheckpointManager:
             'document': state['document'].model_dump(mode='json'),
             'file_path': state['file_path'],
             'processing_stage': state['processing_stage'],
-            'layout_regions': [region.model_dump(mode='json') for region in state['layout_regions']],
+            'layout_regions': [region.to_dict(mode='json') for region in state['layout_regions']],
             'ocr_results': state['ocr_results'],
             'vision_results': state['vision_results'],
             'conflicts': [conflict.model_dump(mode='json') for conflict in state['conflicts']],
@@ -170,10 +177,10 @@ class CheckpointManager:
             'document': Document(**data['document']),
             'file_path': data['file_path'],
             'processing_stage': data['processing_stage'],
-            'layout_regions': [Region(**region) for region in data['layout_regions']],
+            'layout_regions': Region.build_many(data['layout_regions']),
             'ocr_results': data['ocr_results'],
             'vision_results': data['vision_results'],
-            'conflicts': [Conflict(**conflict) for conflict in data['conflicts']],
+            'conflicts': Conflict.build_many(data['conflicts']),
             'resolutions': [ConflictResolution(**res) for res in data['resolutions']],
             'error_log': data['error_log']
         }
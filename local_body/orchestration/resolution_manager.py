@@ -128,14 +128,14 @@ class ManualResolutionManager:
             if page:
                 break
         
-        if not page or not page.raw_image_bytes:
+        if not page or not page.has_raw_image:
             logger.warning(f"Page or image data not found for region {conflict.region_id}")
             return None
         
         # Crop the image to the bounding box
         try:
             cropped_bytes = self._crop_image_to_bbox(
-                page.raw_image_bytes,
+                page.read_raw_image(),
                 region.bbox
             )
             
@@ -6,6 +6,7 @@ execution, conditional routing, and human-in-the-loop integration.
 Requirements: 5.2 (Parallel Extraction), 11.3 (Conflict Detection), 11.5 (Human Review)
 """
 
+import asyncio
 from typing import Dict, Any, Literal
 from loguru import logger
 
@@ -20,6 +21,7 @@ from local_body.orchestration.nodes import (
     human_review_node
 )
 from local_body.orchestration.checkpoint import CheckpointManager
+from local_body.core.cache import prefetch_document_stages
 
 
 def route_after_validation(state: DocumentProcessingState) -> Literal["end", "auto_resolve", "human_review"]:
@@ -136,11 +138,18 @@ class DocumentWorkflow:
         """
         doc_id = state['document'].id
         logger.info(f"Starting workflow for document {doc_id}")
+        result = None
         
         try:
             # Save initial checkpoint
             self.checkpoint_manager.save_checkpoint(doc_id, state)
             
+            # Warm cached stage results so the parallel nodes hit memory
+            # (disk reads and key hashing run off the event loop)
+            file_path = getattr(state['document'], 'file_path', None)
+            if isinstance(file_path, str):
+                await asyncio.to_thread(prefetch_document_stages, [file_path])
+            
             # Run workflow asynchronously
             result = await self.graph.ainvoke(state)
             
@@ -163,6 +172,12 @@ class DocumentWorkflow:
             state['error_log'] = state.get('error_log', []) + [str(e)]
             self.checkpoint_manager.save_checkpoint(doc_id, state)
             raise
+        
+        finally:
+            # Decoded page images are shared by the stages of this run only
+            state['document'].release_decoded_images()
+            if result is not None and result.get('document') is not state['document']:
+                result['document'].release_decoded_images()
     
     def resume(self, doc_id: str) -> DocumentProcessingState:
         """Resume workflow from checkpoint.
@@ -6,7 +6,8 @@ with robust error handling for corrupted files.
 
 import io
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from uuid import uuid4
 
 from loguru import logger
 from PIL import Image
@@ -58,13 +59,17 @@ class DocumentLoader:
     - Structured Document object creation
     """
     
-    def __init__(self, dpi: int = 300):
+    def __init__(self, dpi: int = 300, image_store_dir: Optional[str] = None):
         """Initialize the document loader.
         
         Args:
             dpi: DPI for PDF to image conversion (default: 300)
+            image_store_dir: If set, page PNGs are written to one page-store
+                file per document in this directory and pages hold an
+                ImageRef instead of the bytes
         """
         self.dpi = dpi
+        self.image_store_dir = Path(image_store_dir) if image_store_dir else None
     
     def load_document(self, file_path: str) -> Document:
         """Load a PDF document and convert to Document object.
@@ -99,6 +104,12 @@ class DocumentLoader:
             # Convert PDF pages to images
             page_images = self._convert_to_images(file_path)
             
+            # Optional out-of-line page store, one file per loaded document
+            page_store = None
+            if self.image_store_dir is not None:
+                self.image_store_dir.mkdir(parents=True, exist_ok=True)
+                page_store = self.image_store_dir / f"{file_path.stem}.{uuid4().hex[:8]}.pages"
+            
             # Create Page objects
             pages = []
             for page_num, pil_image in enumerate(page_images, start=1):
@@ -114,6 +125,11 @@ class DocumentLoader:
                     raw_image_bytes=raw_image_bytes,
                     processed_image_bytes=None  # Will be set after preprocessing
                 )
+                # Offer the rendered image to the agents (kept for the run) so
+                # they don't re-decode the PNG
+                page.set_decoded_image(pil_image)
+                if page_store is not None:
+                    page.spill_raw_image(page_store)
                 pages.append(page)
             
             # Create Document object
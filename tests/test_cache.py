@@ -0,0 +1,117 @@
+"""Tests for CacheManager storage, keys and the in-memory front cache."""
+
+import time
+from unittest.mock import call, patch
+
+import pytest
+
+from local_body.core.cache import CacheManager
+from local_body.core.datamodels import BoundingBox, Region, RegionType, TextContent
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    """Fresh CacheManager on a temporary directory (the singleton is restored after)."""
+    previous = CacheManager._instance
+    CacheManager._instance = None
+    manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    yield manager
+    manager.cache.close()
+    CacheManager._instance = previous
+
+
+def make_regions():
+    """Layout-style cached value: a list of Region dataclasses."""
+    return [
+        Region(
+            bbox=BoundingBox(x=1.0, y=2.0, width=3.0, height=4.0),
+            region_type=RegionType.TEXT,
+            content=TextContent(text="", confidence=0.9),
+            confidence=0.9,
+            extraction_method="yolov8"
+        )
+    ]
+
+
+class TestCacheRoundTrip:
+    """Test values come back as they were stored."""
+    
+    def test_plain_data_round_trip(self, cache_manager):
+        """Test JSON-like values, tuples and bytes survive a set/get."""
+        value = {"text": "abc", "scores": [0.5, 1.0], "pair": (1, 2), "raw": b"\x00\x01"}
+        assert cache_manager.set("ocr:test", value)
+        
+        assert cache_manager.get("ocr:test") == value
+        assert cache_manager.get("ocr:missing") is None
+    
+    def test_dataclass_round_trip(self, cache_manager):
+        """Test cached Region lists come back equal."""
+        regions = make_regions()
+        cache_manager.set("layout:test", regions)
+        
+        assert cache_manager.get("layout:test") == regions
+    
+    def test_clear_by_stage(self, cache_manager):
+        """Test clearing one stage keeps the others."""
+        cache_manager.set("ocr:a", 1)
+        cache_manager.set("layout:a", 2)
+        
+        assert cache_manager.clear_by_stage("ocr") == 1
+        assert cache_manager.get("ocr:a") is None
+        assert cache_manager.get("layout:a") == 2
+    
+    def test_strict_hash_env(self, tmp_path, monkeypatch):
+        """Test the strict-hash override accepts the same values as the config loader."""
+        monkeypatch.setenv("SOVEREIGN_CACHE_STRICT_HASH", "on")
+        previous = CacheManager._instance
+        CacheManager._instance = None
+        try:
+            manager = CacheManager(cache_dir=str(tmp_path / "strict"))
+            assert manager.strict_hash is True
+            manager.cache.close()
+        finally:
+            CacheManager._instance = previous
+
+
+class TestFrontCache:
+    """Test the in-memory LRU in front of the disk cache."""
+    
+    def test_hits_are_independent_copies(self, cache_manager):
+        """Test mutating a returned value never changes later hits."""
+        cache_manager.set("layout:test", make_regions())
+        
+        # Second disk hit admits the key; the next get is served from memory
+        for _ in range(3):
+            regions = cache_manager.get("layout:test")
+            regions[0].content = TextContent(text="filled by OCR", confidence=0.8)
+        
+        assert cache_manager.mem_hits >= 1
+        assert cache_manager.get("layout:test")[0].content.text == ""
+    
+    def test_set_replaces_front_cache_entry(self, cache_manager):
+        """Test a new value is visible even when the key was hot."""
+        cache_manager.set("ocr:test", "old")
+        for _ in range(3):
+            cache_manager.get("ocr:test")
+        
+        cache_manager.set("ocr:test", "new")
+        
+        assert cache_manager.get("ocr:test") == "new"
+
+
+class TestAuditTrail:
+    """Test the write-behind audit worker."""
+    
+    def test_queued_entries_written(self, cache_manager):
+        """Test an entry queued on an idle cache is written by the worker."""
+        expected = call(action="cache_set", resource="cache", resource_id="ocr:abc123", metadata=None)
+        with patch("local_body.core.cache.get_privacy_manager") as get_privacy:
+            audit_log = get_privacy.return_value.audit_log
+            cache_manager._audit("cache_set", "ocr:abc123")
+            
+            # Workers of earlier managers may flush through the same patch too
+            deadline = time.monotonic() + 2.0
+            while expected not in audit_log.call_args_list and time.monotonic() < deadline:
+                time.sleep(0.01)
+        
+        assert expected in audit_log.call_args_list
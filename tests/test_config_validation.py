@@ -352,3 +352,44 @@ class TestEnvironmentVariables:
         del os.environ['SOVEREIGN_ENV']
         del os.environ['SOVEREIGN_CONFLICT_THRESHOLD']
         del os.environ['SOVEREIGN_BATCH_SIZE']
+
+
+class TestConfigFileCache:
+    """Test reuse of the parsed config file."""
+    
+    def test_yaml_reparsed_when_file_changes(self, tmp_path):
+        """Test that an edited config file is picked up on the next load."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("batch_size: 7\n")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        
+        manager = ConfigManager(str(config_file))
+        assert manager.load_config().batch_size == 7
+        assert manager.load_config().batch_size == 7
+        
+        config_file.write_text("batch_size: 9\n")
+        os.utime(config_file, ns=(2_000_000_000, 2_000_000_000))
+        
+        assert manager.load_config().batch_size == 9
+    
+    def test_peek_mode_reads_header(self, tmp_path):
+        """Test that peek_mode finds the mode near the top or falls back to a full parse."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("profile: dev\nprocessing_mode: local\n")
+        assert ConfigManager(str(config_file)).peek_mode() == "local"
+        
+        # Key beyond the header window: found by the full YAML parse
+        config_file.write_text("# " + "x" * 1024 + "\nprocessing_mode: remote\n")
+        assert ConfigManager(str(config_file)).peek_mode() == "remote"
+        
+        assert ConfigManager(str(tmp_path / "missing.yaml")).peek_mode() == "hybrid"
+    
+    def test_default_config_shared_across_missing_files(self, tmp_path):
+        """Test that defaults-only loads are reused but hand out independent copies."""
+        first = ConfigManager(str(tmp_path / "a.yaml")).load_config()
+        first.batch_size = 99
+        
+        second = ConfigManager(str(tmp_path / "b.yaml")).load_config()
+        
+        assert second.batch_size != 99
+        assert second.profile == "dev"
@@ -7,11 +7,11 @@ and data integrity validation methods.
 import json
 import pytest
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 from local_body.core.datamodels import (
     Document, DocumentMetadata, Page, Region, RegionType,
-    BoundingBox, TextContent, ProcessingStatus
+    BoundingBox, TextContent, ProcessingStatus, REGION_TYPE_CODES
 )
 
 
@@ -83,6 +83,37 @@ class TestDocumentPersistence:
             assert loaded_page.page_number == orig_page.page_number
             assert len(loaded_page.regions) == len(orig_page.regions)
     
+    def test_created_at_roundtrip(self, tmp_path):
+        """Test that created_at is an aware UTC datetime that survives a round-trip."""
+        metadata = DocumentMetadata(page_count=0, file_size_bytes=100)
+        doc = Document(file_path="test.pdf", metadata=metadata)
+        
+        assert isinstance(doc.created_at, datetime)
+        assert doc.created_at.tzinfo is not None
+        
+        json_path = tmp_path / "ts.json"
+        doc.save_to_json(str(json_path), compress=False)
+        loaded = Document.from_json(str(json_path))
+        
+        assert loaded.created_at == doc.created_at
+        assert loaded.created_at_ns == doc.created_at_ns
+    
+    def test_naive_legacy_created_at_is_utc(self, tmp_path):
+        """Test that naive timestamps from the old utcnow default load as UTC."""
+        doc = Document(
+            file_path="test.pdf",
+            metadata=DocumentMetadata(page_count=0, file_size_bytes=100)
+        )
+        data = json.loads(doc.model_dump_json())
+        data['created_at'] = "2024-01-01T12:00:00.000001"
+        json_path = tmp_path / "legacy.json"
+        json_path.write_text(json.dumps(data), encoding='utf-8')
+        
+        loaded = Document.from_json(str(json_path))
+        
+        assert loaded.created_at == datetime(2024, 1, 1, 12, 0, 0, 1, tzinfo=timezone.utc)
+        assert loaded.created_at_ns == 1704110400_000001000
+    
     def test_save_creates_parent_directory(self, tmp_path):
         """Test that save_to_json creates parent directories if needed."""
         metadata = DocumentMetadata(
@@ -230,9 +261,7 @@ class TestDocumentIntegrity:
         assert "1" in error_msg
     
     def test_validate_integrity_negative_bbox_width(self):
-        """Test that negative bounding box width is caught by Pydantic validation."""
-        from pydantic import ValidationError
-        
+        """Test that negative bounding box width is rejected at construction."""
         metadata = DocumentMetadata(
             page_count=1,
             file_size_bytes=1024
@@ -240,9 +269,9 @@ class TestDocumentIntegrity:
         
         text_content = TextContent(text="Test", confidence=0.9)
         
-        # This should fail at Pydantic validation level
-        # because BoundingBox has ge=0 constraint
-        with pytest.raises(ValidationError):
+        # This should fail at construction because BoundingBox
+        # rejects negative sizes in __post_init__
+        with pytest.raises(ValueError):
             # Attempting to create BoundingBox with negative width
             bbox = BoundingBox(x=10.0, y=20.0, width=-50.0, height=50.0)
     
@@ -327,3 +356,184 @@ class TestDocumentIntegrity:
         
         # Should pass validation
         assert doc.validate_integrity() is True
+
+
+class TestPageArrays:
+    """Test the structure-of-arrays view of page regions."""
+    
+    def test_to_arrays_matches_regions(self):
+        """Test that array rows follow region order and values."""
+        regions = [
+            Region(
+                bbox=BoundingBox(x=1.0, y=2.0, width=3.0, height=4.0),
+                region_type=RegionType.TEXT,
+                content=TextContent(text="A", confidence=0.9),
+                confidence=0.9,
+                extraction_method="ocr"
+            ),
+            Region(
+                bbox=BoundingBox(x=5.0, y=6.0, width=7.0, height=8.0),
+                region_type=RegionType.TABLE,
+                content=TextContent(text="B", confidence=0.4),
+                confidence=0.4,
+                extraction_method="ocr"
+            )
+        ]
+        arrays = Page(page_number=1, regions=regions).to_arrays()
+        
+        assert arrays['bbox_xywh'].shape == (2, 4)
+        assert arrays['bbox_xywh'][1].tolist() == [5.0, 6.0, 7.0, 8.0]
+        assert (arrays['confidences'] > 0.5).tolist() == [True, False]
+        assert arrays['region_types'][1] == REGION_TYPE_CODES[RegionType.TABLE]
+    
+    def test_to_arrays_empty_page(self):
+        """Test that a page without regions yields empty arrays."""
+        arrays = Page(page_number=1).to_arrays()
+        
+        assert arrays['bbox_xywh'].shape == (0, 4)
+        assert arrays['confidences'].size == 0
+    
+    def test_build_many_regions(self):
+        """Test bulk validation of region dicts."""
+        raw = [
+            {
+                'bbox': {'x': 1.0, 'y': 2.0, 'width': 3.0, 'height': 4.0},
+                'region_type': 'text',
+                'content': {'text': f"line {i}", 'confidence': 0.8},
+                'confidence': 0.8,
+                'extraction_method': 'ocr'
+            }
+            for i in range(3)
+        ]
+        regions = Region.build_many(raw)
+        
+        assert [r.content.text for r in regions] == ["line 0", "line 1", "line 2"]
+        assert regions[0].region_type is RegionType.TEXT
+        
+        raw[1]['confidence'] = 1.5
+        with pytest.raises(ValueError):
+            Region.build_many(raw)
+    
+    def test_content_variant_picked_by_keys(self):
+        """Test that region content dicts validate into the matching content class."""
+        base = {
+            'bbox': {'x': 0.0, 'y': 0.0, 'width': 1.0, 'height': 1.0},
+            'region_type': 'table',
+            'confidence': 0.9,
+            'extraction_method': 'ocr'
+        }
+        table = Region.from_dict({**base, 'content': {'rows': [["a", "b"]], 'confidence': 0.9}})
+        image = Region.from_dict({**base, 'content': {'description': "chart", 'confidence': 0.9}})
+        
+        assert table.content.rows == [["a", "b"]]
+        assert image.content.description == "chart"
+        assert Region.from_dict(table.to_dict(mode='json')) == table
+    
+    def test_constructor_converts_nested_dicts(self):
+        """Test Region(**dict) builds bbox/content objects or rejects bad values."""
+        region = Region(
+            bbox={'x': 1.0, 'y': 2.0, 'width': 3.0, 'height': 4.0},
+            region_type='text',
+            content={'text': "total", 'confidence': 0.8},
+            confidence=0.9,
+            extraction_method='ocr'
+        )
+        
+        assert isinstance(region.bbox, BoundingBox)
+        assert isinstance(region.content, TextContent)
+        assert region.bbox.x == 1.0
+        
+        with pytest.raises(ValueError):
+            Region(
+                bbox={'x': -1.0, 'y': 0.0, 'width': 1.0, 'height': 1.0},
+                region_type='text',
+                content={'text': "", 'confidence': 0.8},
+                confidence=0.9,
+                extraction_method='ocr'
+            )
+        with pytest.raises(ValueError):
+            Region(
+                bbox=region.bbox,
+                region_type='text',
+                content={'text': "", 'confidence': 1.5},
+                confidence=0.9,
+                extraction_method='ocr'
+            )
+        with pytest.raises(TypeError):
+            Region(
+                bbox=(1.0, 2.0, 3.0, 4.0),
+                region_type='text',
+                content=region.content,
+                confidence=0.9,
+                extraction_method='ocr'
+            )
+
+
+class TestPageImageRef:
+    """Test out-of-line page images."""
+    
+    def test_spill_and_read_raw_image(self, tmp_path):
+        """Test that a spilled image reads back and survives JSON round-trip."""
+        store = tmp_path / "doc.pages"
+        page1 = Page(page_number=1, raw_image_bytes=b"first image")
+        page2 = Page(page_number=2, raw_image_bytes=b"second")
+        page2.set_decoded_image(object())
+        page1.spill_raw_image(store)
+        page2.spill_raw_image(store)
+        
+        assert page2.decoded_image is None  # spilling frees the bitmap too
+        
+        assert page2.raw_image_bytes is None
+        assert page2.raw_image_ref.offset == len(b"first image")
+        assert page2.has_raw_image
+        assert page2.read_raw_image() == b"second"
+        assert isinstance(page2.read_raw_image(), bytes)
+        
+        doc = Document(
+            file_path="test.pdf",
+            pages=[page1, page2],
+            metadata=DocumentMetadata(page_count=2, file_size_bytes=100)
+        )
+        loaded = Document(**json.loads(doc.model_dump_json()))
+        
+        assert loaded.pages[0].read_raw_image() == b"first image"
+
+
+class TestPageDecodedImage:
+    """Test the shared decoded-image cache."""
+    
+    def test_decoded_images_shared_across_stages(self):
+        """Test every stage of a long document reuses the loader's decode."""
+        pages = [Page(page_number=i, raw_image_bytes=b"img%d" % i) for i in range(1, 11)]
+        document = Document(
+            file_path="/test/long.pdf",
+            pages=pages,
+            metadata=DocumentMetadata(page_count=10, file_size_bytes=1024)
+        )
+        images = [object() for _ in pages]
+        for page, image in zip(pages, images):
+            page.set_decoded_image(image)
+        
+        # Layout, OCR and vision each walk every page in order
+        for _ in range(3):
+            assert [page.get_decoded_image() for page in pages] == images
+        
+        document.release_decoded_images()
+        assert all(page.decoded_image is None for page in pages)
+    
+    def test_decoded_images_capped(self, monkeypatch):
+        """Test unreleased pages are evicted least recently used first."""
+        monkeypatch.setattr("local_body.core.datamodels._DECODED_PAGES_MAX", 4)
+        pages = [Page(page_number=i, raw_image_bytes=b"img%d" % i) for i in range(1, 7)]
+        for page in pages:
+            page.set_decoded_image(object())
+        
+        kept = [page.decoded_image is not None for page in pages]
+        assert kept == [False, False, True, True, True, True]
+        
+        # Replacing the raw image invalidates the decoded one
+        pages[-1].raw_image_bytes = b"other"
+        assert pages[-1].decoded_image is None
+        
+        for page in pages:
+            page.release_decoded_image()
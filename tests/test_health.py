@@ -87,7 +87,22 @@ class TestAlertSystem:
         # Should return existing alert
         assert alert1 is alert2
         assert len(alerts.get_active_alerts()) == 1
-    
+
+    def test_duplicate_alert_after_resolution(self):
+        """Test that a resolved alert no longer suppresses a new one."""
+        alerts = AlertSystem()
+
+        alert1 = alerts.add_alert(AlertSeverity.WARNING, AlertComponent.NETWORK, "Connection slow")
+        alerts.resolve_alerts(component=AlertComponent.NETWORK)
+        alert2 = alerts.add_alert(AlertSeverity.WARNING, AlertComponent.NETWORK, "Connection slow")
+        assert alert2 is not alert1
+
+        # Resolving the alert object directly must also clear the dedup entry
+        alert2.resolve()
+        alert3 = alerts.add_alert(AlertSeverity.WARNING, AlertComponent.NETWORK, "Connection slow")
+        assert alert3 is not alert2
+        assert len(alerts.get_active_alerts()) == 1
+
     def test_get_active_alerts(self):
         """Test retrieving active alerts."""
         alerts = AlertSystem()
@@ -161,7 +176,63 @@ class TestAlertSystem:
         assert summary["active_alerts"] == 2
         assert summary["resolved_alerts"] == 1
         assert summary["critical_active"] == 0 or summary["critical_active"] == 1  # Depends on which was resolved
-    
+
+    def test_alert_filters_combined(self):
+        """Test combined component/severity/resolved filters stay in insertion order."""
+        alerts = AlertSystem()
+
+        a1 = alerts.add_alert(AlertSeverity.WARNING, AlertComponent.SYSTEM, "RAM high")
+        a2 = alerts.add_alert(AlertSeverity.CRITICAL, AlertComponent.SYSTEM, "CPU hot")
+        a3 = alerts.add_alert(AlertSeverity.WARNING, AlertComponent.SYSTEM, "Disk slow")
+        alerts.add_alert(AlertSeverity.WARNING, AlertComponent.DATABASE, "DB slow")
+        a3.resolve()
+
+        assert alerts.get_active_alerts(
+            component=AlertComponent.SYSTEM, severity=AlertSeverity.WARNING
+        ) == [a1]
+        assert alerts.get_all_alerts(component=AlertComponent.SYSTEM) == [a1, a2, a3]
+        assert alerts.get_all_alerts(resolved=True) == [a3]
+        assert alerts.get_alert_summary()["warning_active"] == 2
+
+    def test_direct_resolve_updates_indexes(self):
+        """Test Alert.resolve() moves the alert between indexes without a rescan."""
+        alerts = AlertSystem()
+
+        alert = alerts.add_alert(AlertSeverity.WARNING, AlertComponent.NETWORK, "Tunnel down")
+        alert.resolve()
+
+        assert alerts._active == {}
+        assert alerts.get_all_alerts(resolved=True) == [alert]
+        # The message can be raised again as a new alert
+        assert alerts.add_alert(AlertSeverity.WARNING, AlertComponent.NETWORK, "Tunnel down") is not alert
+
+        # Cleared alerts are detached and never come back on resolve
+        cleared = alerts.add_alert(AlertSeverity.INFO, AlertComponent.STORAGE, "Disk 80%")
+        alerts.clear_alerts(component=AlertComponent.STORAGE)
+        cleared.resolve()
+        assert cleared not in alerts.get_all_alerts(resolved=True)
+
+    def test_alert_history_limit(self):
+        """Test that a full history evicts resolved alerts before active ones."""
+        alerts = AlertSystem()
+
+        added = [
+            alerts.add_alert(AlertSeverity.INFO, AlertComponent.SYSTEM, f"Alert {i}")
+            for i in range(alerts._max_history)
+        ]
+        added[10].resolve()
+
+        alerts.add_alert(AlertSeverity.INFO, AlertComponent.SYSTEM, "Overflow 1")
+        history = alerts.get_all_alerts()
+        assert len(history) == alerts._max_history
+        assert added[10] not in history
+        assert added[0] in history
+
+        # With nothing resolved, the oldest alert goes
+        alerts.add_alert(AlertSeverity.INFO, AlertComponent.SYSTEM, "Overflow 2")
+        assert added[0] not in alerts.get_all_alerts()
+        assert alerts.get_alert_summary()["active_alerts"] == alerts._max_history
+
     def test_get_critical_alerts(self):
         """Test retrieving only critical alerts."""
         alerts = AlertSystem()
@@ -7,8 +7,10 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from uuid import uuid4
 import io
+import numpy as np
 from PIL import Image
 
+from local_body.agents import ocr_agent
 from local_body.agents.ocr_agent import OCRAgent
 from local_body.core.datamodels import (
     Document,
@@ -293,3 +295,49 @@ class TestOCRAgent:
         assert isinstance(region.content, TextContent)
         assert region.content.text == ""
         assert region.content.confidence == 0.0
+    
+    def test_crop_region_formats(self, mock_config, sample_document_with_regions):
+        """Test 11: Crops stay as ndarrays by default; encoded formats are opt-in."""
+        page = sample_document_with_regions.pages[0]
+        bbox = page.regions[0].bbox
+        
+        with patch('local_body.agents.ocr_agent.PaddleOCR'):
+            agent = OCRAgent(mock_config)
+            crop = agent._crop_region(page.raw_image_bytes, bbox)
+            assert isinstance(crop, np.ndarray)
+            assert crop.shape == (20, 80, 3)
+            
+            agent = OCRAgent({**mock_config, "crop_format": "jpg"})
+            crop = agent._crop_region(page.raw_image_bytes, bbox)
+            assert isinstance(crop, bytes)
+            assert crop[:2] == b'\xff\xd8'
+            
+            with pytest.raises(ValueError):
+                OCRAgent({**mock_config, "crop_format": "tiff"})
+    
+    @pytest.mark.asyncio
+    async def test_page_decoded_once(self, mock_config, sample_document_with_regions):
+        """Test 12: Each page is decoded once, not once per region."""
+        page = sample_document_with_regions.pages[0]
+        page.regions.append(
+            Region(
+                bbox=BoundingBox(x=10, y=50, width=80, height=20),
+                region_type=RegionType.TEXT,
+                content=TextContent(text="", confidence=0.0),
+                confidence=0.9,
+                extraction_method="yolov8"
+            )
+        )
+        
+        with patch('local_body.agents.ocr_agent.PaddleOCR'):
+            agent = OCRAgent(mock_config)
+            agent._process_single_region = AsyncMock(return_value=("text", 0.9))
+            
+            with patch.object(ocr_agent.cv2, 'imdecode', wraps=ocr_agent.cv2.imdecode) as imdecode:
+                await agent.process(sample_document_with_regions)
+            
+            assert imdecode.call_count == 1
+            assert agent._process_single_region.await_count == 2
+        
+        with pytest.raises(ValueError):
+            agent._decode_page(b"not an image")
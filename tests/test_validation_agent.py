@@ -67,6 +67,24 @@ class TestNumericExtraction:
         """Test 4: Extract from natural text"""
         result = validation_agent.extract_numeric_value("Revenue appears to be $50M")
         assert result == 50_000_000
+    
+    def test_extract_scanner_edge_cases(self, validation_agent):
+        """Test 4b: Suffixed number wins over earlier plain numbers; signs survive currency"""
+        assert validation_agent.extract_numeric_value("Q3 revenue $5M") == 5_000_000
+        assert validation_agent.extract_numeric_value("-$5") == -5.0
+        assert validation_agent.extract_numeric_value(".5") == 0.5
+        assert validation_agent.extract_numeric_value("No numbers") is None
+    
+    def test_extraction_cache(self, validation_agent):
+        """Test 4c: Repeated strings are served from the extraction cache"""
+        ValidationAgent.clear_numeric_cache()
+        validation_agent.extract_numeric_value("$7.5M")
+        validation_agent.extract_numeric_value("$7.5M")
+        
+        stats = ValidationAgent.get_numeric_cache_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
 
 
 class TestConflictDetection:
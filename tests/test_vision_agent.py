@@ -49,7 +49,7 @@ class TestVisionAgentCache:
         key2 = vision_agent._generate_cache_key(image, query)
         
         assert key1 == key2
-        assert len(key1) == 32  # MD5 hash length
+        assert len(key1) == 32  # 128-bit hex digest
     
     @pytest.mark.asyncio
     async def test_different_inputs_different_keys(self, vision_agent):
@@ -71,6 +71,36 @@ class TestVisionAgentRemote:
         with pytest.raises(ConnectionError, match="tunnel not active"):
             await vision_agent.analyze_image_remote(b"test", "query")
 
+    
+    @pytest.mark.asyncio
+    async def test_http_client_reused(self, vision_agent):
+        """Test 3b: One keep-alive client is shared within an event loop"""
+        client1 = vision_agent._get_client()
+        client2 = vision_agent._get_client()
+        assert client1 is client2
+        
+        await vision_agent.aclose()
+        assert client1.is_closed
+        assert vision_agent._get_client() is not client1
+        await vision_agent.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_process_closes_its_client(self, vision_agent):
+        """Test 3c: process() shares one client across pages and closes it on return"""
+        from local_body.core.datamodels import Document, DocumentMetadata, Page
+        
+        document = Document(
+            file_path="/test/doc.pdf",
+            pages=[Page(page_number=i, raw_image_bytes=b"img") for i in (1, 2)],
+            metadata=DocumentMetadata(page_count=2, file_size_bytes=10)
+        )
+        with patch.object(vision_agent, '_analyze_page') as mock_analyze:
+            await vision_agent.process(document)
+        
+        clients = {call.args[2] for call in mock_analyze.call_args_list}
+        assert len(clients) == 1
+        assert clients.pop().is_closed
+        assert vision_agent._client is None
 
 class TestVisionAgentFallback:
     """Test local fallback functionality"""
@@ -109,6 +139,16 @@ class TestVisionAgentIntegration:
         assert 'misses' in stats
         assert stats['entries'] == 0  # Empty cache initially
     
+    def test_cache_lru_eviction(self, vision_agent):
+        """Test 6b: Cache is bounded and evicts least recently used entries"""
+        vision_agent.cache_max = 2
+        vision_agent._store_cached('a', '1')
+        vision_agent._store_cached('b', '2')
+        vision_agent._cache.move_to_end('a')  # 'a' used most recently
+        vision_agent._store_cached('c', '3')
+        
+        assert list(vision_agent._cache) == ['a', 'c']
+    
     def test_clear_cache(self, vision_agent):
         """Test 7: Cache clearing"""
         # Add fake cache entry
@@ -119,3 +159,27 @@ class TestVisionAgentIntegration:
         vision_agent.clear_cache()
         
         assert len(vision_agent._cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_spilled_page_analyzed(self, vision_agent, mock_tunnel, tmp_path):
+        """Test 8: A page whose image lives in a page store is analyzed like inline bytes"""
+        from io import BytesIO
+        from PIL import Image
+        from local_body.core.datamodels import Page
+        
+        buf = BytesIO()
+        Image.new("RGB", (64, 64), "white").save(buf, format="JPEG")
+        page = Page(page_number=1, raw_image_bytes=buf.getvalue())
+        page.spill_raw_image(tmp_path / "doc.pages")
+        
+        # Small JPEG passthrough hands the stored bytes on unchanged
+        image_bytes = page.read_raw_image()
+        assert vision_agent._compress_image(image_bytes) == buf.getvalue()
+        
+        # Remote path (cache key, tunnel check) then local fallback
+        mock_tunnel.get_status.return_value = {'active': False, 'public_url': None}
+        with patch.object(vision_agent, '_analyze_local', return_value="summary") as mock_local:
+            await vision_agent._analyze_page(page, 1)
+        
+        mock_local.assert_called_once()
+        assert page.metadata['vision_summary'] == "summary"
@@ -103,6 +103,37 @@ class TestImageCompression:
         # Height should be proportional: 1024 * (1000/3000) = 341
         assert 340 <= compressed_img.height <= 342
     
+    def test_small_jpeg_passthrough(self, vision_agent):
+        """Test 4b: Small JPEGs that already fit are sent unchanged"""
+        img = Image.effect_noise((400, 300), 64).convert('RGB')
+        buffer = BytesIO()
+        img.save(buffer, format='JPEG', quality=90)
+        original_bytes = buffer.getvalue()
+        
+        assert vision_agent._compress_image(original_bytes) is original_bytes
+    
+    def test_never_inflates_upload(self, vision_agent):
+        """Test 4d: Images a JPEG cannot shrink are sent as the original bytes"""
+        img = Image.new('RGB', (64, 64), color='white')
+        buffer = BytesIO()
+        img.save(buffer, format='PNG')
+        original_bytes = buffer.getvalue()
+        
+        assert vision_agent._compress_image(original_bytes) is original_bytes
+    
+    def test_predecoded_image_reused(self, vision_agent, large_image_bytes):
+        """Test 4c: A shared decoded image is used without being modified"""
+        decoded = Image.open(BytesIO(large_image_bytes))
+        decoded.load()
+        
+        with patch('local_body.agents.vision_agent.Image.open') as mock_open:
+            compressed = vision_agent._compress_image(large_image_bytes, decoded=decoded)
+            mock_open.assert_not_called()
+        
+        assert decoded.size == (2000, 2000)
+        img = Image.open(BytesIO(compressed))
+        assert max(img.size) <= 1024
+    
     def test_compression_failure_fallback(self, vision_agent):
         """Test 5: Compression failure returns original bytes"""
         invalid_bytes = b"not an image"
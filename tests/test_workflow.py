@@ -154,6 +154,23 @@ class TestWorkflowGraph:
         assert workflow.graph is not None
         assert workflow.checkpoint_manager is not None
     
+    @pytest.mark.asyncio
+    async def test_run_releases_decoded_images(self, tmp_path, base_state):
+        """Test 7b: Decoded page images are released when the run ends"""
+        workflow = DocumentWorkflow(checkpoint_dir=str(tmp_path))
+        page = base_state['document'].pages[0]
+        page.raw_image_bytes = b"img"
+        page.set_decoded_image(object())
+        
+        async def fake_ainvoke(state):
+            assert page.decoded_image is not None
+            return {**state, 'processing_stage': ProcessingStage.COMPLETE}
+        
+        with patch.object(workflow.graph, 'ainvoke', side_effect=fake_ainvoke):
+            await workflow.run(base_state)
+        
+        assert page.decoded_image is None
+    
     def test_routing_logic_integration(self, base_state, low_impact_conflict, high_impact_conflict):
         """Test 8: Routing logic correctly identifies paths"""
         # No conflicts → end